@@ -2,7 +2,7 @@
 
 import time
 import logging
-from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from ..utils.logging_config import log_info, log_warning
 
@@ -33,18 +33,25 @@ class TokenBucket:
     request consumes one token.
     """
     
-    def __init__(self, rate: float, capacity: int):
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        time_func: Callable[[], float] = time.monotonic
+    ):
         """
         Initialize token bucket.
         
         Args:
             rate: Tokens added per second
             capacity: Maximum token capacity (burst size)
+            time_func: Monotonic clock returning seconds (injectable for tests)
         """
         self.rate = rate
         self.capacity = capacity
         self.tokens = float(capacity)
-        self.last_update = time.time()
+        self._now = time_func
+        self.last_update = self._now()
     
     def consume(self, tokens: int = 1) -> bool:
         """
@@ -56,7 +63,7 @@ class TokenBucket:
         Returns:
             True if tokens were consumed, False if insufficient tokens
         """
-        now = time.time()
+        now = self._now()
         
         # Refill tokens based on time elapsed
         elapsed = now - self.last_update
@@ -73,74 +80,107 @@ class TokenBucket:
         
         return False
     
-    def get_retry_after(self) -> float:
+    def get_retry_after(self, tokens: int = 1) -> float:
         """
-        Calculate seconds until next token available.
+        Calculate seconds until the requested tokens are available.
         
+        Args:
+            tokens: Number of tokens that will be requested
+            
         Returns:
             Seconds to wait
         """
-        if self.tokens >= 1:
+        if self.tokens >= tokens:
             return 0.0
         
-        tokens_needed = 1 - self.tokens
+        tokens_needed = tokens - self.tokens
         return tokens_needed / self.rate
 
 class SlidingWindowCounter:
     """
     Sliding window counter for per-minute rate limiting.
     
-    Maintains a sliding window of timestamps to enforce per-minute limits.
+    Keeps the timestamps of the last ``limit`` admitted requests in a
+    fixed-size ring buffer. A request is allowed when the slot it would
+    overwrite has already left the window, so each check is O(1) and never
+    allocates.
     """
     
-    def __init__(self, limit: int, window_seconds: int = 60):
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: int = 60,
+        time_func: Callable[[], float] = time.monotonic
+    ):
         """
         Initialize sliding window counter.
         
         Args:
             limit: Maximum requests in window
             window_seconds: Window size in seconds
+            time_func: Monotonic clock returning seconds (injectable for tests)
         """
         self.limit = limit
         self.window_seconds = window_seconds
-        self.timestamps = deque()
+        # Empty slots hold -inf so they are always outside the window
+        self._timestamps = [float('-inf')] * limit
+        self._head = 0  # Slot of the oldest recorded request
+        self._now = time_func
+    
+    def _slot(self, count: int) -> int:
+        """Index of the ``count``-th oldest recorded request."""
+        return (self._head + min(count, self.limit) - 1) % self.limit
     
-    def is_allowed(self) -> bool:
+    def is_allowed(self, count: int = 1) -> bool:
         """
-        Check if request is allowed within the window.
+        Check if requests are allowed within the window.
         
+        Args:
+            count: Number of requests to record
+            
         Returns:
             True if allowed, False if rate limited
         """
-        now = time.time()
-        cutoff = now - self.window_seconds
+        if count > self.limit:
+            return False
         
-        # Remove old timestamps
-        while self.timestamps and self.timestamps[0] < cutoff:
-            self.timestamps.popleft()
+        now = self._now()
         
-        # Check if under limit
-        if len(self.timestamps) < self.limit:
-            self.timestamps.append(now)
-            return True
+        # The count-th oldest request must have left the window
+        if self._timestamps[self._slot(count)] >= now - self.window_seconds:
+            return False
         
-        return False
+        for _ in range(count):
+            self._timestamps[self._head] = now
+            self._head = (self._head + 1) % self.limit
+        
+        return True
     
-    def get_retry_after(self) -> float:
+    def get_retry_after(self, count: int = 1) -> float:
         """
-        Calculate seconds until oldest request expires.
+        Calculate seconds until enough old requests expire.
         
+        Args:
+            count: Number of requests that will be recorded
+            
         Returns:
             Seconds to wait
         """
-        if not self.timestamps:
-            return 0.0
-        
-        now = time.time()
-        oldest = self.timestamps[0]
+        now = self._now()
+        oldest = self._timestamps[self._slot(count)]
         wait_time = self.window_seconds - (now - oldest)
         
         return max(0.0, wait_time)
+    
+    def requests_in_window(self) -> int:
+        """
+        Count recorded requests that are still inside the window.
+        
+        Returns:
+            Number of requests in the current window
+        """
+        cutoff = self._now() - self.window_seconds
+        return sum(1 for ts in self._timestamps if ts >= cutoff)
 
 class EnhancedRateLimiter:
     """
@@ -153,14 +193,21 @@ class EnhancedRateLimiter:
     - Metrics collection
     """
     
-    def __init__(self, config: RateLimitConfig = None):
+    def __init__(
+        self,
+        config: RateLimitConfig = None,
+        time_func: Callable[[], float] = time.monotonic
+    ):
         """
         Initialize rate limiter.
         
         Args:
             config: Rate limit configuration
+            time_func: Monotonic clock returning seconds, shared with the
+                per-client limiters (injectable for tests)
         """
         self.config = config or RateLimitConfig()
+        self.time_func = time_func
         
         # Per-IP rate limiters
         self.token_buckets: dict[str, TokenBucket] = {}
@@ -175,7 +222,7 @@ class EnhancedRateLimiter:
         }
         
         # Cleanup tracking
-        self.last_cleanup = time.time()
+        self.last_cleanup = self.time_func()
         self.cleanup_interval = 300  # 5 minutes
         
         log_info(
@@ -196,7 +243,34 @@ class EnhancedRateLimiter:
         Returns:
             Tuple of (is_allowed, retry_after_seconds)
         """
-        self.metrics['total_requests'] += 1
+        return self.try_acquire(client_id)
+    
+    def try_acquire(self, client_id: str, tokens: int = 1) -> tuple[bool, float]:
+        """
+        Atomically acquire several request slots for client.
+        
+        Either all requested tokens are granted or none are, so batch
+        callers (e.g. bulk affiliate link generation) can reserve capacity
+        with a single call.
+        
+        Args:
+            client_id: Client identifier (usually IP address)
+            tokens: Number of requests to acquire
+            
+        Returns:
+            Tuple of (is_allowed, retry_after_seconds)
+            
+        Raises:
+            ValueError: If tokens is less than 1 or larger than the burst
+                size or per-minute limit, as such a request can never succeed
+        """
+        if tokens < 1:
+            raise ValueError(f"tokens must be at least 1, got {tokens}")
+        max_tokens = min(self.config.burst_size, self.config.rate_per_minute)
+        if tokens > max_tokens:
+            raise ValueError(f"tokens must be at most {max_tokens}, got {tokens}")
+        
+        self.metrics['total_requests'] += tokens
         
         # Periodic cleanup of old entries
         self._cleanup_if_needed()
@@ -205,30 +279,36 @@ class EnhancedRateLimiter:
         if client_id not in self.token_buckets:
             self.token_buckets[client_id] = TokenBucket(
                 self.config.rate_per_second,
-                self.config.burst_size
+                self.config.burst_size,
+                time_func=self.time_func
             )
             self.sliding_windows[client_id] = SlidingWindowCounter(
-                self.config.rate_per_minute
+                self.config.rate_per_minute,
+                time_func=self.time_func
             )
             self.metrics['unique_ips'] += 1
         
         token_bucket = self.token_buckets[client_id]
         sliding_window = self.sliding_windows[client_id]
         
-        # Check both rate limiters
-        token_allowed = token_bucket.consume()
-        window_allowed = sliding_window.is_allowed()
+        # Check both rate limiters; the window only records admitted requests
+        token_allowed = token_bucket.consume(tokens)
+        window_allowed = sliding_window.is_allowed(tokens) if token_allowed else True
+        
+        if not window_allowed:
+            # Return tokens so a rejected request does not drain the bucket
+            token_bucket.tokens += tokens
         
         if token_allowed and window_allowed:
-            self.metrics['allowed_requests'] += 1
+            self.metrics['allowed_requests'] += tokens
             return True, 0.0
         
         # Rate limited - calculate retry-after
-        self.metrics['blocked_requests'] += 1
+        self.metrics['blocked_requests'] += tokens
         
         retry_after = max(
-            token_bucket.get_retry_after() if not token_allowed else 0.0,
-            sliding_window.get_retry_after() if not window_allowed else 0.0
+            token_bucket.get_retry_after(tokens) if not token_allowed else 0.0,
+            sliding_window.get_retry_after(tokens) if not window_allowed else 0.0
         )
         
         log_warning(
@@ -264,7 +344,7 @@ class EnhancedRateLimiter:
         sliding_window = self.sliding_windows[client_id]
         
         # Update tokens
-        now = time.time()
+        now = self.time_func()
         elapsed = now - token_bucket.last_update
         current_tokens = min(
             token_bucket.capacity,
@@ -273,7 +353,7 @@ class EnhancedRateLimiter:
         
         return {
             'tokens_available': int(current_tokens),
-            'requests_in_window': len(sliding_window.timestamps),
+            'requests_in_window': sliding_window.requests_in_window(),
             'limit_per_second': self.config.rate_per_second,
             'limit_per_minute': self.config.rate_per_minute,
             'burst_capacity': self.config.burst_size
@@ -309,7 +389,7 @@ class EnhancedRateLimiter:
     
     def _cleanup_if_needed(self) -> None:
         """Cleanup old entries periodically."""
-        now = time.time()
+        now = self.time_func()
         
         if now - self.last_cleanup < self.cleanup_interval:
             return
@@ -17,7 +17,7 @@ class CategoryResponse:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
 
-@dataclass
+@dataclass(slots=True)
 class ProductResponse:
     """
     Response model for product data with automatic affiliate link conversion.
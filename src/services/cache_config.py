@@ -1,7 +1,9 @@
 """Cache configuration for optimal API call reduction."""
 
+import dataclasses
 from dataclasses import dataclass
 from typing import ClassVar
+import functools
 import os
 
 @dataclass
@@ -50,7 +52,24 @@ class CacheConfig:
     
     @classmethod
     def from_env(cls) -> 'CacheConfig':
-        """Load cache configuration from environment variables."""
+        """
+        Load cache configuration from environment variables.
+        
+        The environment is parsed once and cached; each call returns a
+        fresh copy that callers may modify freely. Call
+        ``CacheConfig.clear_env_cache()`` to pick up environment changes.
+        """
+        return dataclasses.replace(cls._load_env())
+    
+    @classmethod
+    def clear_env_cache(cls) -> None:
+        """Drop the cached environment so the next from_env() re-reads it."""
+        cls._load_env.cache_clear()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_env(cls) -> 'CacheConfig':
+        """Parse cache settings from environment variables."""
         return cls(
             product_metadata_ttl=int(os.getenv('CACHE_PRODUCT_TTL', '86400')),
             affiliate_links_ttl=int(os.getenv('CACHE_AFFILIATE_TTL', '2592000')),
@@ -1,12 +1,78 @@
 """Data validation and sanitization service for API responses."""
 
+import functools
 import logging
 import re
-from typing import Optional, Tuple, List
+from typing import Iterable, Iterator, Optional, Tuple, List
 from ..models.responses import ProductResponse
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; these run for every product in a search page
+URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Values already in the form sanitize_product produces; digit counts stay
+# within float precision so matching strings round-trip unchanged
+UNNORMALIZED_WHITESPACE_PATTERN = re.compile(r'^\s|\s$|\s\s|[^\S ]')
+NORMALIZED_PRICE_PATTERN = re.compile(r'(?:0|[1-9]\d{0,11})\.\d\d')
+NORMALIZED_COMMISSION_PATTERN = re.compile(r'(?:0|[1-9]\d{0,11})\.\d%')
+
+# Machine-readable validation issue codes returned by validate_product
+ISSUE_PRODUCT_ID_MISSING = "product_id_missing"
+ISSUE_PRODUCT_ID_INVALID = "product_id_invalid"
+ISSUE_TITLE_MISSING = "title_missing"
+ISSUE_TITLE_TOO_SHORT = "title_too_short"
+ISSUE_TITLE_TOO_LONG = "title_too_long"
+ISSUE_URL_MISSING = "url_missing"
+ISSUE_URL_INVALID = "url_invalid"
+ISSUE_PRICE_TOO_LOW = "price_too_low"
+ISSUE_PRICE_TOO_HIGH = "price_too_high"
+ISSUE_PRICE_INVALID = "price_invalid"
+ISSUE_CURRENCY_MISSING = "currency_missing"
+ISSUE_CURRENCY_INVALID = "currency_invalid"
+ISSUE_IMAGE_URL_INVALID = "image_url_invalid"
+ISSUE_COMMISSION_RATE_SUSPICIOUS = "commission_rate_suspicious"
+ISSUE_COMMISSION_RATE_INVALID = "commission_rate_invalid"
+
+@functools.lru_cache(maxsize=4096)
+def _matches_url(url: str) -> bool:
+    """
+    Match a URL string against URL_PATTERN.
+    
+    Memoized: paginated and cached searches revalidate the same URLs.
+    
+    Args:
+        url: URL string to match
+        
+    Returns:
+        True if the URL matches
+    """
+    return bool(URL_PATTERN.match(url))
+
+@functools.lru_cache(maxsize=256)
+def parse_commission_rate(commission_rate: str) -> float:
+    """
+    Parse a commission rate string such as "8.0%" into a float.
+    
+    Memoized: a search page uses only a handful of distinct rates.
+    
+    Args:
+        commission_rate: Commission rate with optional trailing percent sign
+        
+    Returns:
+        Commission rate as a float (e.g., 8.0)
+        
+    Raises:
+        ValueError: If the rate is not numeric
+    """
+    return float(commission_rate.rstrip('%'))
+
 class ProductDataValidator:
     """
     Validate and sanitize product data from AliExpress API.
@@ -14,8 +80,12 @@ class ProductDataValidator:
     Ensures data quality and consistency before returning to clients.
     """
     
-    # Valid currency codes
-    VALID_CURRENCIES = ['USD', 'EUR', 'GBP', 'CAD', 'AUD', 'BRL', 'RUB', 'JPY', 'CNY']
+    # Valid currency codes; includes every currency Config accepts so
+    # products priced in the configured currency are not rejected
+    VALID_CURRENCIES = frozenset({
+        'USD', 'EUR', 'GBP', 'CAD', 'AUD', 'BRL', 'RUB', 'JPY', 'CNY',
+        'UAH', 'MXN', 'TRY', 'INR', 'IDR', 'SEK', 'KRW'
+    })
     
     # Price limits (in USD equivalent)
     MIN_PRICE = 0.01
@@ -34,78 +104,149 @@ class ProductDataValidator:
             product: Product response to validate
             
         Returns:
-            Tuple of (is_valid, list_of_issues)
+            Tuple of (is_valid, list_of_issues); issues are ISSUE_* codes
+        """
+        fields = (
+            product.product_id,
+            product.product_title,
+            product.product_url,
+            product.price,
+            product.currency,
+            product.image_url,
+            product.commission_rate
+        )
+        # Only memoize well-typed products; malformed values may be unhashable
+        if all(value is None or isinstance(value, str) for value in fields):
+            is_valid, issues = cls._validate_fields_cached(*fields)
+        else:
+            is_valid, issues = cls._validate_fields(*fields)
+        return is_valid, list(issues)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _validate_fields_cached(
+        cls,
+        product_id: str,
+        product_title: str,
+        product_url: str,
+        price: str,
+        currency: str,
+        image_url: Optional[str],
+        commission_rate: Optional[str]
+    ) -> Tuple[bool, Tuple[str, ...]]:
+        """
+        Memoized _validate_fields for string-valued products.
+        
+        Search pages and cached results repeat the same products, so
+        identical field values skip the regex and parsing work. Warnings for
+        malformed values are logged once per distinct product.
+        
+        Args:
+            product_id, product_title, ...: Field values from validate_product
+            
+        Returns:
+            Tuple of (is_valid, tuple_of_issues)
         """
-        issues = []
+        return cls._validate_fields(
+            product_id, product_title, product_url, price,
+            currency, image_url, commission_rate
+        )
+    
+    @classmethod
+    def _validate_fields(
+        cls,
+        product_id: str,
+        product_title: str,
+        product_url: str,
+        price: str,
+        currency: str,
+        image_url: Optional[str],
+        commission_rate: Optional[str]
+    ) -> Tuple[bool, Tuple[str, ...]]:
+        """
+        Validate the checked product fields.
+        
+        Args:
+            product_id, product_title, ...: Field values from validate_product
+            
+        Returns:
+            Tuple of (is_valid, tuple_of_issues)
+        """
+        # At most one issue per field group; collected into a tuple once at the end
+        id_issue = title_issue = url_issue = price_issue = None
+        currency_issue = image_issue = commission_issue = None
         
         # Required field validation
-        if not product.product_id:
-            issues.append("Missing product_id")
-        elif not isinstance(product.product_id, str) or len(product.product_id) < 5:
-            issues.append(f"Invalid product_id format: {product.product_id}")
+        if not product_id:
+            id_issue = ISSUE_PRODUCT_ID_MISSING
+        elif not isinstance(product_id, str) or len(product_id) < 5:
+            id_issue = ISSUE_PRODUCT_ID_INVALID
         
         # Title validation
-        if not product.product_title:
-            issues.append("Missing product_title")
-        elif len(product.product_title) < cls.MIN_TITLE_LENGTH:
-            issues.append(f"Product title too short: {len(product.product_title)} chars")
-        elif len(product.product_title) > cls.MAX_TITLE_LENGTH:
-            issues.append(f"Product title too long: {len(product.product_title)} chars")
+        if not product_title:
+            title_issue = ISSUE_TITLE_MISSING
+        elif len(product_title) < cls.MIN_TITLE_LENGTH:
+            title_issue = ISSUE_TITLE_TOO_SHORT
+        elif len(product_title) > cls.MAX_TITLE_LENGTH:
+            title_issue = ISSUE_TITLE_TOO_LONG
         
         # URL validation
-        if not product.product_url:
-            issues.append("Missing product_url")
-        elif not cls._is_valid_url(product.product_url):
-            issues.append(f"Invalid product_url format: {product.product_url}")
+        if not product_url:
+            url_issue = ISSUE_URL_MISSING
+        elif not cls._is_valid_url(product_url):
+            url_issue = ISSUE_URL_INVALID
         
         # Price validation
         try:
-            price = float(product.price)
-            if price < cls.MIN_PRICE:
-                issues.append(f"Price too low: {price}")
-            elif price > cls.MAX_PRICE:
-                issues.append(f"Price suspiciously high: {price}")
+            price_value = float(price)
+            if price_value < cls.MIN_PRICE:
+                price_issue = ISSUE_PRICE_TOO_LOW
+            elif price_value > cls.MAX_PRICE:
+                price_issue = ISSUE_PRICE_TOO_HIGH
         except (ValueError, TypeError) as e:
             logger.warning(
                 "Invalid price format during validation",
                 extra={
-                    "product_id": product.product_id,
-                    "price": product.price,
+                    "product_id": product_id,
+                    "price": price,
                     "error_type": type(e).__name__
                 }
             )
-            issues.append(f"Invalid price format: {product.price}")
+            price_issue = ISSUE_PRICE_INVALID
         
         # Currency validation
-        if product.currency:
-            if product.currency.upper() not in cls.VALID_CURRENCIES:
-                issues.append(f"Invalid currency code: {product.currency}")
+        if currency:
+            if currency.upper() not in cls.VALID_CURRENCIES:
+                currency_issue = ISSUE_CURRENCY_INVALID
         else:
-            issues.append("Missing currency")
+            currency_issue = ISSUE_CURRENCY_MISSING
         
         # Image URL validation (optional but should be valid if present)
-        if product.image_url and not cls._is_valid_url(product.image_url):
-            issues.append(f"Invalid image_url format: {product.image_url}")
+        if image_url and not cls._is_valid_url(image_url):
+            image_issue = ISSUE_IMAGE_URL_INVALID
         
         # Commission rate validation (optional)
-        if product.commission_rate:
+        if commission_rate:
             try:
-                rate = float(product.commission_rate.rstrip('%'))
+                rate = parse_commission_rate(commission_rate)
                 if rate < 0 or rate > 50:
-                    issues.append(f"Suspicious commission rate: {product.commission_rate}")
+                    commission_issue = ISSUE_COMMISSION_RATE_SUSPICIOUS
             except (ValueError, TypeError, AttributeError) as e:
                 logger.warning(
                     "Invalid commission rate format during validation",
                     extra={
-                        "product_id": product.product_id,
-                        "commission_rate": product.commission_rate,
+                        "product_id": product_id,
+                        "commission_rate": commission_rate,
                         "error_type": type(e).__name__
                     }
                 )
-                issues.append(f"Invalid commission_rate format: {product.commission_rate}")
+                commission_issue = ISSUE_COMMISSION_RATE_INVALID
         
-        is_valid = len(issues) == 0
-        return is_valid, issues
+        issues = tuple(filter(None, (
+            id_issue, title_issue, url_issue, price_issue,
+            currency_issue, image_issue, commission_issue
+        )))
+        return not issues, issues
     
     @classmethod
     def sanitize_product(cls, product: ProductResponse) -> ProductResponse:
@@ -118,11 +259,15 @@ class ProductDataValidator:
         Returns:
             Sanitized product response
         """
+        # Products from the API mapper are usually clean already
+        if cls._is_normalized(product):
+            return product
+        
         # Trim whitespace from strings
         if product.product_title:
             product.product_title = product.product_title.strip()
             # Remove excessive whitespace
-            product.product_title = re.sub(r'\s+', ' ', product.product_title)
+            product.product_title = WHITESPACE_PATTERN.sub(' ', product.product_title)
         
         # Normalize currency code
         if product.currency:
@@ -154,7 +299,7 @@ class ProductDataValidator:
         if product.commission_rate:
             try:
                 # Ensure it's in percentage format
-                rate = float(product.commission_rate.rstrip('%'))
+                rate = parse_commission_rate(product.commission_rate)
                 product.commission_rate = f"{rate:.1f}%"
             except (ValueError, TypeError, AttributeError) as e:
                 logger.warning(
@@ -180,14 +325,78 @@ class ProductDataValidator:
         Returns:
             Tuple of (sanitized_product, is_valid, issues)
         """
-        # First sanitize
-        sanitized_product = cls.sanitize_product(product)
+        # Clean, valid products are the common case; skip the string rebuilds
+        is_valid, issues = cls.validate_product(product)
+        if is_valid and cls._is_normalized(product):
+            return product, is_valid, issues
         
-        # Then validate
+        sanitized_product = cls.sanitize_product(product)
         is_valid, issues = cls.validate_product(sanitized_product)
         
         return sanitized_product, is_valid, issues
     
+    @staticmethod
+    def _is_normalized(product: ProductResponse) -> bool:
+        """
+        Check whether sanitize_product would leave the product unchanged.
+        
+        Args:
+            product: Product response to check
+            
+        Returns:
+            True if every sanitized field is already in normalized form
+        """
+        title = product.product_title
+        if title and UNNORMALIZED_WHITESPACE_PATTERN.search(title):
+            return False
+        currency = product.currency
+        if currency and (not currency.isupper() or currency != currency.strip()):
+            return False
+        if not isinstance(product.price, str) or not NORMALIZED_PRICE_PATTERN.fullmatch(product.price):
+            return False
+        if product.product_url and product.product_url != product.product_url.strip():
+            return False
+        if product.image_url and product.image_url != product.image_url.strip():
+            return False
+        if product.commission_rate and not NORMALIZED_COMMISSION_PATTERN.fullmatch(product.commission_rate):
+            return False
+        return True
+    
+    @classmethod
+    def iter_valid_products(
+        cls,
+        products: Iterable[ProductResponse],
+        log_invalid: bool = True
+    ) -> Iterator[ProductResponse]:
+        """
+        Lazily sanitize products and yield only the valid ones.
+        
+        Args:
+            products: Products to filter
+            log_invalid: Whether to log invalid products
+            
+        Yields:
+            Sanitized valid products
+        """
+        validate_and_sanitize = cls.validate_and_sanitize
+        
+        for product in products:
+            sanitized_product, is_valid, issues = validate_and_sanitize(product)
+            
+            if is_valid:
+                yield sanitized_product
+            elif log_invalid:
+                logger.warning(
+                    f"Invalid product filtered out: {product.product_id}",
+                    extra={
+                        'extra_fields': {
+                            'product_id': product.product_id,
+                            'issues': issues,
+                            'product_title': product.product_title[:50] if product.product_title else None
+                        }
+                    }
+                )
+    
     @classmethod
     def filter_valid_products(
         cls,
@@ -204,29 +413,9 @@ class ProductDataValidator:
         Returns:
             Tuple of (valid_products, valid_count, invalid_count)
         """
-        valid_products = []
-        invalid_count = 0
-        
-        for product in products:
-            sanitized_product, is_valid, issues = cls.validate_and_sanitize(product)
-            
-            if is_valid:
-                valid_products.append(sanitized_product)
-            else:
-                invalid_count += 1
-                if log_invalid:
-                    logger.warning(
-                        f"Invalid product filtered out: {product.product_id}",
-                        extra={
-                            'extra_fields': {
-                                'product_id': product.product_id,
-                                'issues': issues,
-                                'product_title': product.product_title[:50] if product.product_title else None
-                            }
-                        }
-                    )
-        
+        valid_products = list(cls.iter_valid_products(products, log_invalid))
         valid_count = len(valid_products)
+        invalid_count = len(products) - valid_count
         
         if invalid_count > 0:
             logger.info(
@@ -254,23 +443,34 @@ class ProductDataValidator:
         Returns:
             True if valid, False otherwise
         """
+        # Checked before the memoized match, which needs a hashable argument
         if not url or not isinstance(url, str):
             return False
         
-        # Basic URL validation
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        return bool(url_pattern.match(url))
+        return _matches_url(url)
 
 class SearchResultValidator:
     """Validate search result quality and apply filters."""
     
+    @staticmethod
+    def iter_unique_products(products: Iterable[ProductResponse]) -> Iterator[ProductResponse]:
+        """
+        Lazily yield the first product for each product_id.
+        
+        Args:
+            products: Products to deduplicate
+            
+        Yields:
+            Products whose product_id has not been seen yet
+        """
+        seen_ids = set()
+        
+        for product in products:
+            product_id = product.product_id
+            if product_id not in seen_ids:
+                seen_ids.add(product_id)
+                yield product
+    
     @classmethod
     def deduplicate_products(cls, products: List[ProductResponse]) -> List[ProductResponse]:
         """
@@ -282,65 +482,83 @@ class SearchResultValidator:
         Returns:
             Deduplicated list of products
         """
-        seen_ids = set()
-        unique_products = []
-        duplicate_count = 0
-        
-        for product in products:
-            if product.product_id not in seen_ids:
-                seen_ids.add(product.product_id)
-                unique_products.append(product)
-            else:
-                duplicate_count += 1
+        unique_products = list(cls.iter_unique_products(products))
         
+        duplicate_count = len(products) - len(unique_products)
         if duplicate_count > 0:
             logger.info(f"Removed {duplicate_count} duplicate products")
         
         return unique_products
     
-    @classmethod
-    def apply_quality_filters(
-        cls,
-        products: List[ProductResponse],
+    @staticmethod
+    def iter_quality_filtered(
+        products: Iterable[ProductResponse],
         min_commission_rate: Optional[float] = None,
         require_image: bool = False
-    ) -> List[ProductResponse]:
+    ) -> Iterator[ProductResponse]:
         """
-        Apply quality filters to products.
+        Lazily yield products that pass the quality filters.
         
         Args:
-            products: List of products to filter
+            products: Products to filter
             min_commission_rate: Minimum commission rate (e.g., 5.0 for 5%)
             require_image: Whether to require image URL
             
-        Returns:
-            Filtered list of products
+        Yields:
+            Products passing every requested filter
         """
-        filtered_products = []
+        check_commission = min_commission_rate is not None
+        min_rate = float(min_commission_rate) if min_commission_rate is not None else 0.0
         
         for product in products:
+            # Check image requirement first; it is a cheap None test
+            if require_image and not product.image_url:
+                continue
+            
             # Check commission rate
-            if min_commission_rate is not None and product.commission_rate:
+            commission_rate = product.commission_rate
+            if check_commission and commission_rate:
                 try:
-                    rate = float(product.commission_rate.rstrip('%'))
-                    if rate < min_commission_rate:
+                    if parse_commission_rate(commission_rate) < min_rate:
                         continue
                 except (ValueError, TypeError, AttributeError) as e:
                     logger.debug(
                         "Skipping product due to invalid commission rate format",
                         extra={
                             "product_id": product.product_id,
-                            "commission_rate": product.commission_rate,
+                            "commission_rate": commission_rate,
                             "error_type": type(e).__name__
                         }
                     )
                     continue
             
-            # Check image requirement
-            if require_image and not product.image_url:
-                continue
+            yield product
+    
+    @classmethod
+    def apply_quality_filters(
+        cls,
+        products: List[ProductResponse],
+        min_commission_rate: Optional[float] = None,
+        require_image: bool = False
+    ) -> List[ProductResponse]:
+        """
+        Apply quality filters to products.
+        
+        Args:
+            products: List of products to filter
+            min_commission_rate: Minimum commission rate (e.g., 5.0 for 5%)
+            require_image: Whether to require image URL
             
-            filtered_products.append(product)
+        Returns:
+            Filtered list of products
+        """
+        # No filters requested: skip the per-product pass entirely
+        if min_commission_rate is None and not require_image:
+            return list(products)
+        
+        filtered_products = list(
+            cls.iter_quality_filtered(products, min_commission_rate, require_image)
+        )
         
         removed_count = len(products) - len(filtered_products)
         if removed_count > 0:
@@ -17,7 +17,7 @@ from ..models.responses import (
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class SmartSearchResponse:
     """Enhanced search response with caching metadata."""
     products: List['ProductWithAffiliateResponse']
@@ -76,9 +76,11 @@ class SmartSearchResponse:
             SmartSearchResponse with all required fields initialized for fallback
         """
         # Convert products to ProductWithAffiliateResponse format
-        enhanced_products = []
-        for product in basic_result.products:
-            enhanced_product = ProductWithAffiliateResponse(
+        # One timestamp for the whole batch
+        generated_at = datetime.utcnow()
+        product_cls = ProductWithAffiliateResponse
+        enhanced_products = [
+            product_cls(
                 product_id=product.product_id,
                 product_title=product.product_title,
                 product_url=product.product_url,
@@ -95,9 +97,10 @@ class SmartSearchResponse:
                 affiliate_status="fallback_basic_service",
                 affiliate_error=None,
                 cached_at=None,
-                generated_at=datetime.utcnow()
+                generated_at=generated_at
             )
-            enhanced_products.append(enhanced_product)
+            for product in basic_result.products
+        ]
         
         # Create SmartSearchResponse with all required fields properly initialized
         return cls(
@@ -109,7 +112,7 @@ class SmartSearchResponse:
             cache_hit=False,  # No cache in fallback
             cached_at=None,
             affiliate_links_cached=0,  # Critical: Initialize to prevent NameError
-            affiliate_links_generated=len(enhanced_products) if enhanced_products else 0,
+            affiliate_links_generated=len(enhanced_products),
             api_calls_saved=0,  # No savings in fallback
             response_time_ms=response_time_ms,
             # Service metadata for fallback indication
@@ -118,7 +121,7 @@ class SmartSearchResponse:
             enhanced_features_available=False
         )
 
-@dataclass
+@dataclass(slots=True)
 class ProductWithAffiliateResponse:
     """Product response with integrated affiliate link."""
     # Standard product fields
@@ -374,6 +377,8 @@ class EnhancedAliExpressService(AliExpressService):
             )
             
             # Step 4: Convert to enhanced products
+            # One timestamp for the whole page instead of a clock read per product
+            generated_at = None if affiliate_generation_failed else datetime.utcnow()
             enhanced_products = []
             
             for product in search_result.products:
@@ -393,7 +398,7 @@ class EnhancedAliExpressService(AliExpressService):
                     affiliate_url=affiliate_url,
                     affiliate_status=affiliate_status,
                     affiliate_error="Affiliate link generation failed, using original URL" if affiliate_generation_failed else None,
-                    generated_at=datetime.utcnow() if not affiliate_generation_failed else None
+                    generated_at=generated_at
                 )
                 enhanced_products.append(enhanced_product)
             
@@ -439,6 +444,7 @@ class EnhancedAliExpressService(AliExpressService):
         enhanced_products = []
         urls_needing_generation = []
         url_to_product_map = {}
+        now = datetime.utcnow()
         
         # Extract product URLs
         product_urls = [product.product_url for product in products]
@@ -458,7 +464,7 @@ class EnhancedAliExpressService(AliExpressService):
                     **product.to_dict(),
                     affiliate_url=cached_link.affiliate_url,
                     affiliate_status="cached",
-                    cached_at=datetime.utcnow()
+                    cached_at=now
                 )
                 enhanced_products.append(enhanced_product)
                 logger.debug(f"Using cached affiliate link for product {product.product_id}")
@@ -493,7 +499,7 @@ class EnhancedAliExpressService(AliExpressService):
                             **original_product.to_dict(),
                             affiliate_url=new_link.affiliate_url,
                             affiliate_status="generated",
-                            generated_at=datetime.utcnow()
+                            generated_at=now
                         )
                     else:
                         # Link generation failed for this URL
@@ -534,6 +540,7 @@ class EnhancedAliExpressService(AliExpressService):
         # Create lookup map
         cached_links_map = {link.original_url: link for link in cached_links}
         
+        now = datetime.utcnow()
         enhanced_products = []
         for product in products:
             if product.product_url in cached_links_map:
@@ -542,7 +549,7 @@ class EnhancedAliExpressService(AliExpressService):
                     **product.to_dict(),
                     affiliate_url=cached_link.affiliate_url,
                     affiliate_status="cached",
-                    cached_at=datetime.utcnow()
+                    cached_at=now
                 )
             else:
                 enhanced_product = ProductWithAffiliateResponse(
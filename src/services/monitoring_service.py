@@ -1,14 +1,16 @@
 """Monitoring and metrics collection service for production observability."""
 
 import logging
+import sys
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, Any, Dict, Deque, List
-from collections import deque
+from typing import Optional, Any, Dict, Deque, Iterable, List, Tuple
+from collections import Counter, deque
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for a single request."""
     endpoint: str
@@ -20,6 +22,12 @@ class PerformanceMetrics:
     status_code: int = 200
     error_type: Optional[str] = None
     
+    def __post_init__(self) -> None:
+        """Intern the low-cardinality labels shared by buffered metrics."""
+        self.endpoint = sys.intern(self.endpoint)
+        if self.error_type is not None:
+            self.error_type = sys.intern(self.error_type)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -33,7 +41,7 @@ class PerformanceMetrics:
             'error_type': self.error_type
         }
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedStats:
     """Aggregated statistics over a time window."""
     total_requests: int = 0
@@ -49,10 +57,10 @@ class AggregatedStats:
     max_response_time: float = 0.0
     
     # Error tracking
-    errors_by_type: Dict[str, int] = field(default_factory=dict)
+    errors_by_type: Counter = field(default_factory=Counter)
     
     # Endpoint statistics
-    requests_by_endpoint: Dict[str, int] = field(default_factory=dict)
+    requests_by_endpoint: Counter = field(default_factory=Counter)
     
     @property
     def avg_response_time(self) -> float:
@@ -133,6 +141,14 @@ class MonitoringService:
         # Percentile tracking (for p50, p95, p99)
         self.response_times: Deque[float] = deque(maxlen=buffer_size)
         
+        # (sequence number, metrics) for buffered requests over the slow
+        # threshold, so get_slow_requests() does not scan the whole buffer
+        self._slow_requests: Deque[Tuple[int, PerformanceMetrics]] = deque()
+        self._recorded_count: int = 0
+        
+        # Percentiles from the last get_stats(); dropped whenever a request is recorded
+        self._percentiles_cache: Optional[Dict[str, float]] = None
+        
         logger.info(f"Monitoring service initialized with buffer_size={buffer_size}, slow_threshold={slow_request_threshold_ms}ms")
     
     def record_request(self, metrics: PerformanceMetrics) -> None:
@@ -142,53 +158,124 @@ class MonitoringService:
         Args:
             metrics: Performance metrics for the request
         """
+        response_time = metrics.response_time_ms
+        is_slow = response_time > self.slow_request_threshold_ms
+        
         # Add to buffer
         self.metrics_buffer.append(metrics)
-        self.response_times.append(metrics.response_time_ms)
+        self.response_times.append(response_time)
+        self._percentiles_cache = None
+        
+        # Track slow requests, dropping the one that just left metrics_buffer
+        self._recorded_count += 1
+        slow_requests = self._slow_requests
+        if slow_requests and slow_requests[0][0] <= self._recorded_count - self.buffer_size:
+            slow_requests.popleft()
+        if is_slow:
+            slow_requests.append((self._recorded_count, metrics))
         
         # Update aggregated stats
-        self.stats.total_requests += 1
+        stats = self.stats
+        stats.total_requests += 1
+        stats.total_api_calls += metrics.api_calls_made
+        stats.total_response_time += response_time
+        if response_time < stats.min_response_time:
+            stats.min_response_time = response_time
+        if response_time > stats.max_response_time:
+            stats.max_response_time = response_time
+        stats.requests_by_endpoint[metrics.endpoint] += 1
+        
+        if metrics.cache_hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
         
         if metrics.status_code < 400:
-            self.stats.successful_requests += 1
+            stats.successful_requests += 1
         else:
-            self.stats.failed_requests += 1
+            stats.failed_requests += 1
             
             # Track error types
             if metrics.error_type:
-                self.stats.errors_by_type[metrics.error_type] = \
-                    self.stats.errors_by_type.get(metrics.error_type, 0) + 1
+                stats.errors_by_type[metrics.error_type] += 1
         
-        # Update API call stats
-        self.stats.total_api_calls += metrics.api_calls_made
+        # Log slow requests
+        if is_slow:
+            self._log_slow_request(metrics)
+    
+    def record_batch(self, metrics_batch: Iterable[PerformanceMetrics]) -> None:
+        """
+        Record several requests at once.
         
-        # Update cache stats
-        if metrics.cache_hit:
-            self.stats.cache_hits += 1
-        else:
-            self.stats.cache_misses += 1
+        Equivalent to calling record_request for each item in order, but the
+        buffers are extended and the aggregated statistics updated once per
+        batch instead of once per request.
+        
+        Args:
+            metrics_batch: Performance metrics for the requests, oldest first
+        """
+        batch = list(metrics_batch)
+        if not batch:
+            return
+        
+        response_times = [m.response_time_ms for m in batch]
+        threshold = self.slow_request_threshold_ms
         
-        # Update response time stats
-        self.stats.total_response_time += metrics.response_time_ms
-        self.stats.min_response_time = min(self.stats.min_response_time, metrics.response_time_ms)
-        self.stats.max_response_time = max(self.stats.max_response_time, metrics.response_time_ms)
+        # Add to buffers
+        self.metrics_buffer.extend(batch)
+        self.response_times.extend(response_times)
+        self._percentiles_cache = None
         
-        # Update endpoint stats
-        self.stats.requests_by_endpoint[metrics.endpoint] = \
-            self.stats.requests_by_endpoint.get(metrics.endpoint, 0) + 1
+        # Track slow requests, dropping those no longer in metrics_buffer
+        first_seq = self._recorded_count + 1
+        self._recorded_count += len(batch)
+        new_slow = [(seq, m) for seq, m in enumerate(batch, first_seq) if m.response_time_ms > threshold]
+        slow_requests = self._slow_requests
+        slow_requests.extend(new_slow)
+        oldest_buffered = self._recorded_count - self.buffer_size
+        while slow_requests and slow_requests[0][0] <= oldest_buffered:
+            slow_requests.popleft()
+        
+        # Update aggregated stats
+        stats = self.stats
+        cache_hits = sum(1 for m in batch if m.cache_hit)
+        failed = [m for m in batch if m.status_code >= 400]
+        
+        stats.total_requests += len(batch)
+        stats.total_api_calls += sum(m.api_calls_made for m in batch)
+        stats.total_response_time += sum(response_times)
+        stats.min_response_time = min(stats.min_response_time, min(response_times))
+        stats.max_response_time = max(stats.max_response_time, max(response_times))
+        stats.requests_by_endpoint.update(m.endpoint for m in batch)
+        
+        stats.cache_hits += cache_hits
+        stats.cache_misses += len(batch) - cache_hits
+        
+        stats.successful_requests += len(batch) - len(failed)
+        stats.failed_requests += len(failed)
+        stats.errors_by_type.update(m.error_type for m in failed if m.error_type)
         
         # Log slow requests
-        if metrics.response_time_ms > self.slow_request_threshold_ms:
-            logger.warning(
-                f"Slow request detected: {metrics.endpoint}",
-                extra={
-                    'request_id': metrics.request_id,
-                    'endpoint': metrics.endpoint,
-                    'response_time_ms': metrics.response_time_ms,
-                    'cache_hit': metrics.cache_hit,
-                    'api_calls_made': metrics.api_calls_made
-                }
-            )
+        for _, metrics in new_slow:
+            self._log_slow_request(metrics)
+    
+    def _log_slow_request(self, metrics: PerformanceMetrics) -> None:
+        """
+        Log a request that exceeded the slow request threshold.
+        
+        Args:
+            metrics: Performance metrics for the slow request
+        """
+        logger.warning(
+            f"Slow request detected: {metrics.endpoint}",
+            extra={
+                'request_id': metrics.request_id,
+                'endpoint': metrics.endpoint,
+                'response_time_ms': metrics.response_time_ms,
+                'cache_hit': metrics.cache_hit,
+                'api_calls_made': metrics.api_calls_made
+            }
+        )
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -257,7 +344,9 @@ class MonitoringService:
         Returns:
             List of recent request metrics
         """
-        recent = list(self.metrics_buffer)[-limit:]
+        # Walk back from the newest entry so only `limit` items are touched
+        recent = list(islice(reversed(self.metrics_buffer), limit))
+        recent.reverse()
         return [m.to_dict() for m in recent]
     
     def get_slow_requests(self, threshold_ms: Optional[float] = None) -> List[Dict[str, Any]]:
@@ -271,17 +360,24 @@ class MonitoringService:
             List of slow request metrics
         """
         threshold = threshold_ms or self.slow_request_threshold_ms
-        slow_requests = [
-            m for m in self.metrics_buffer
-            if m.response_time_ms > threshold
-        ]
-        return [m.to_dict() for m in slow_requests]
+        
+        # Thresholds at or above the default only need the slow-request index
+        candidates: Iterable[PerformanceMetrics]
+        if threshold >= self.slow_request_threshold_ms:
+            candidates = (m for _, m in self._slow_requests)
+        else:
+            candidates = self.metrics_buffer
+        
+        return [m.to_dict() for m in candidates if m.response_time_ms > threshold]
     
     def reset_stats(self) -> None:
         """Reset all statistics (useful for testing or periodic resets)."""
         self.stats = AggregatedStats()
         self.metrics_buffer.clear()
         self.response_times.clear()
+        self._slow_requests.clear()
+        self._recorded_count = 0
+        self._percentiles_cache = None
         self.start_time = datetime.utcnow()
         logger.info("Monitoring statistics reset")
     
@@ -289,20 +385,28 @@ class MonitoringService:
         """
         Calculate response time percentiles.
         
+        All other statistics are maintained incrementally by record_request;
+        percentiles need a sort, so the result is reused until the next
+        request is recorded.
+        
         Returns:
             Dictionary with p50, p95, p99 percentiles
         """
+        if self._percentiles_cache is not None:
+            return self._percentiles_cache
+        
         if not self.response_times:
             return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
         
         sorted_times = sorted(self.response_times)
         n = len(sorted_times)
         
-        return {
-            'p50': sorted_times[int(n * 0.50)] if n > 0 else 0.0,
-            'p95': sorted_times[int(n * 0.95)] if n > 0 else 0.0,
-            'p99': sorted_times[int(n * 0.99)] if n > 0 else 0.0
+        self._percentiles_cache = {
+            'p50': sorted_times[int(n * 0.50)],
+            'p95': sorted_times[int(n * 0.95)],
+            'p99': sorted_times[int(n * 0.99)]
         }
+        return self._percentiles_cache
     
     def _format_uptime(self, seconds: float) -> str:
         """
@@ -1,14 +1,29 @@
 """Service capability detection utilities for determining service features."""
 
 import logging
+import weakref
 from typing import Dict, Any, Union
 
 logger = logging.getLogger(__name__)
 
+# Capabilities detected per service instance; entries go away with the instance
+_instance_capabilities: "weakref.WeakKeyDictionary[Any, Dict[str, bool]]" = weakref.WeakKeyDictionary()
+
+# Capabilities provided by service classes; classes are not kept alive by the
+# cache, so per-instance Mock classes do not pile up
+_class_capabilities_cache: "weakref.WeakKeyDictionary[type, Dict[str, bool]]" = weakref.WeakKeyDictionary()
+
 
 class ServiceCapabilityDetector:
     """Utility class for detecting service capabilities and features."""
     
+    # (attribute, capability key) pairs where the attribute's presence is the capability
+    CAPABILITY_ATTRIBUTES = (
+        ('cache_service', 'has_caching'),
+        ('image_service', 'has_image_processing'),
+        ('get_affiliate_links', 'supports_affiliate_links'),
+    )
+    
     @staticmethod
     def has_smart_search(service) -> bool:
         """
@@ -20,7 +35,8 @@ class ServiceCapabilityDetector:
         Returns:
             True if service has smart_product_search method
         """
-        return hasattr(service, 'smart_product_search') and callable(getattr(service, 'smart_product_search'))
+        # A single getattr with a default; callable(None) covers missing attributes and None services
+        return callable(getattr(service, 'smart_product_search', None))
     
     @staticmethod
     def get_service_type(service) -> str:
@@ -45,13 +61,10 @@ class ServiceCapabilityDetector:
         
         # Fallback to method-based detection for real services
         # But be more strict - check if it's actually callable
-        has_smart_search = (hasattr(service, 'smart_product_search') and 
-                           callable(getattr(service, 'smart_product_search', None)))
+        has_smart_search = callable(getattr(service, 'smart_product_search', None))
         has_cache_service = hasattr(service, 'cache_service')
-        has_get_products = (hasattr(service, 'get_products') and 
-                           callable(getattr(service, 'get_products', None)))
-        has_search_products = (hasattr(service, 'search_products') and 
-                              callable(getattr(service, 'search_products', None)))
+        has_get_products = callable(getattr(service, 'get_products', None))
+        has_search_products = callable(getattr(service, 'search_products', None))
         
         if has_smart_search and has_cache_service:
             return "enhanced"
@@ -65,26 +78,64 @@ class ServiceCapabilityDetector:
         """
         Return dictionary of available capabilities.
         
+        The result is remembered per service instance and returned as is
+        on later calls, so capabilities are detected once per service.
+        Treat the result as read-only.
+        
         Args:
             service: Service instance to analyze
             
         Returns:
             Dictionary with capability flags
         """
-        has_smart_search = ServiceCapabilityDetector.has_smart_search(service)
-        has_caching = hasattr(service, 'cache_service')
-        has_image_processing = hasattr(service, 'image_service')
-        supports_affiliate_links = hasattr(service, 'get_affiliate_links')
+        try:
+            cached = _instance_capabilities.get(service)
+        except TypeError:
+            # None, builtins and unhashable objects are not cached
+            cached = None
+        if cached is not None:
+            return cached
         
+        # Class attributes are probed once per class; anything missing there
+        # may still be set on the instance (e.g. in __init__)
+        class_capabilities = ServiceCapabilityDetector._class_capabilities(type(service))
         capabilities = {
-            'has_smart_search': has_smart_search,
-            'has_caching': has_caching,
-            'has_image_processing': has_image_processing,
-            'supports_affiliate_links': supports_affiliate_links,
-            'has_enhanced_features': has_smart_search and has_caching,  # Enhanced if has both smart search and caching
+            key: class_capabilities[key] or hasattr(service, attr)
+            for attr, key in ServiceCapabilityDetector.CAPABILITY_ATTRIBUTES
         }
+        capabilities['has_smart_search'] = (class_capabilities['has_smart_search'] or
+                                            ServiceCapabilityDetector.has_smart_search(service))
+        # Enhanced if has both smart search and caching
+        capabilities['has_enhanced_features'] = (capabilities['has_smart_search'] and
+                                                 capabilities['has_caching'])
         
         logger.debug(f"Service capabilities detected: {capabilities}")
+        
+        try:
+            _instance_capabilities[service] = capabilities
+        except TypeError:
+            pass
+        return capabilities
+    
+    @staticmethod
+    def _class_capabilities(service_class: type) -> Dict[str, bool]:
+        """
+        Probe capabilities provided by attributes of a service class.
+        
+        Args:
+            service_class: Class of the service instance
+            
+        Returns:
+            Dictionary with class-level capability flags
+        """
+        capabilities = _class_capabilities_cache.get(service_class)
+        if capabilities is None:
+            capabilities = {
+                key: hasattr(service_class, attr)
+                for attr, key in ServiceCapabilityDetector.CAPABILITY_ATTRIBUTES
+            }
+            capabilities['has_smart_search'] = callable(getattr(service_class, 'smart_product_search', None))
+            _class_capabilities_cache[service_class] = capabilities
         return capabilities
     
     @staticmethod
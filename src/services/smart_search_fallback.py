@@ -34,9 +34,19 @@ class SmartSearchFallback:
         Delegate attribute access to the basic service.
         
         This allows the fallback to act as a proxy for the basic service
-        while providing the enhanced smart_product_search method.
+        while providing the enhanced smart_product_search method. Resolved
+        methods are stored on the instance so later lookups skip this hook;
+        data attributes are always read live from the basic service.
         """
-        return getattr(self.basic_service, name)
+        value = getattr(self.basic_service, name)
+        if callable(value):
+            self.__dict__[name] = value
+        return value
+    
+    def reset_delegation_cache(self) -> None:
+        """Drop methods cached from the basic service by __getattr__."""
+        for name in [name for name in self.__dict__ if name != 'basic_service']:
+            del self.__dict__[name]
     
     async def smart_product_search(self,
                                  keywords: Optional[str] = None,
@@ -2,6 +2,8 @@
 
 import os
 import logging
+import functools
+import dataclasses
 from dataclasses import dataclass
 from typing import Any, List, Optional
 from dotenv import load_dotenv
@@ -173,7 +175,28 @@ class Config:
     
     @classmethod
     def from_env(cls) -> 'Config':
-        """Load configuration from environment variables."""
+        """
+        Load configuration from environment variables.
+        
+        The environment is parsed once and cached; each call returns a
+        fresh copy, so callers may modify their instance without affecting
+        others. Call ``Config.clear_env_cache()`` to pick up environment
+        changes.
+        
+        Returns:
+            Config populated from the environment
+        """
+        return dataclasses.replace(cls._load_env())
+    
+    @classmethod
+    def clear_env_cache(cls) -> None:
+        """Drop the cached environment so the next from_env() re-reads it."""
+        cls._load_env.cache_clear()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_env(cls) -> 'Config':
+        """Parse environment variables (and .env) into a Config."""
         # Only load .env file if not in serverless environment (Vercel, AWS Lambda, etc.)
         is_serverless = any([
             os.getenv('VERCEL') == '1',
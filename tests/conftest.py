@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+from types import SimpleNamespace
 from typing import Generator, AsyncGenerator
 from unittest.mock import Mock
 from fastapi.testclient import TestClient
@@ -9,7 +10,9 @@ import httpx
 
 from src.api.main import app
 from src.utils.config import Config
+from src.services.cache_config import CacheConfig
 from src.services.aliexpress_service import AliExpressService
+from src.models.responses import CategoryResponse, ProductResponse
 
 
 @pytest.fixture(scope="session")
@@ -20,9 +23,19 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def clear_env_config_caches():
+    """Drop cached from_env() results so tests that patch os.environ see their changes."""
+    Config.clear_env_cache()
+    CacheConfig.clear_env_cache()
+    yield
+    Config.clear_env_cache()
+    CacheConfig.clear_env_cache()
+
+
+@pytest.fixture(scope="session")
 def test_config() -> Config:
-    """Create a test configuration."""
+    """Create a test configuration shared by the session; treat it as read-only."""
     return Config(
         app_key="test_app_key",
         app_secret="test_app_secret",
@@ -35,54 +48,52 @@ def test_config() -> Config:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_aliexpress_api():
-    """Create a mock AliExpress API client."""
+    """
+    Create a mock AliExpress API client shared by the session.
+    
+    Tests that set a side effect must undo it (e.g. with monkeypatch).
+    """
     mock_api = Mock()
     
-    # Mock category responses
-    mock_category = Mock()
-    mock_category.category_id = "123"
-    mock_category.category_name = "Electronics"
+    # SDK results are plain data; only the client methods need call tracking
+    mock_category = SimpleNamespace(category_id="123", category_name="Electronics")
     mock_api.get_parent_categories.return_value = [mock_category]
     mock_api.get_child_categories.return_value = [mock_category]
     
     # Mock product responses
-    mock_product = Mock()
-    mock_product.product_id = "1005003091506814"
-    mock_product.product_title = "Test Product"
-    mock_product.product_detail_url = "https://www.aliexpress.com/item/1005003091506814.html"
-    mock_product.target_sale_price = "29.99"
-    mock_product.target_sale_price_currency = "USD"
-    mock_product.product_main_image_url = "https://example.com/image.jpg"
-    mock_product.commission_rate = "5.0"
-    
-    mock_products_result = Mock()
-    mock_products_result.products = [mock_product]
-    mock_products_result.total_record_count = 1
-    mock_api.get_products.return_value = mock_products_result
+    mock_product = SimpleNamespace(
+        product_id="1005003091506814",
+        product_title="Test Product",
+        product_detail_url="https://www.aliexpress.com/item/1005003091506814.html",
+        target_sale_price="29.99",
+        target_sale_price_currency="USD",
+        product_main_image_url="https://example.com/image.jpg",
+        commission_rate="5.0"
+    )
+    mock_api.get_products.return_value = SimpleNamespace(
+        products=[mock_product],
+        total_record_count=1
+    )
     
     # Mock product details response
-    mock_details_result = Mock()
-    mock_details_result.products = [mock_product]
-    mock_api.get_products_details.return_value = mock_details_result
+    mock_api.get_products_details.return_value = SimpleNamespace(products=[mock_product])
     
     # Mock affiliate link responses
-    mock_link = Mock()
-    mock_link.source_value = "https://www.aliexpress.com/item/1005003091506814.html"
-    mock_link.promotion_link = "https://s.click.aliexpress.com/e/_test_affiliate_link"
-    mock_link.commission_rate = "5.0"
-    
-    mock_links_result = Mock()
-    mock_links_result.promotion_links = [mock_link]
-    mock_api.get_affiliate_links.return_value = mock_links_result
+    mock_link = SimpleNamespace(
+        source_value="https://www.aliexpress.com/item/1005003091506814.html",
+        promotion_link="https://s.click.aliexpress.com/e/_test_affiliate_link",
+        commission_rate="5.0"
+    )
+    mock_api.get_affiliate_links.return_value = SimpleNamespace(promotion_links=[mock_link])
     
     return mock_api
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_aliexpress_service(test_config, mock_aliexpress_api):
-    """Create a mock AliExpress service."""
+    """Create a mock AliExpress service shared by the session."""
     service = AliExpressService(test_config)
     service.api = mock_aliexpress_api
     return service
@@ -102,6 +113,32 @@ async def async_test_client() -> AsyncGenerator[httpx.AsyncClient, None]:
         yield client
 
 
+@pytest.fixture(scope="session")
+def product_factory():
+    """Build ProductResponse objects with placeholder values for unspecified fields."""
+    def make(product_id: str = "1", **overrides) -> ProductResponse:
+        fields = {
+            "product_id": product_id,
+            "product_title": f"Product {product_id}",
+            "product_url": f"https://example.com/{product_id}",
+            "price": "10.00",
+            "currency": "USD",
+        }
+        fields.update(overrides)
+        return ProductResponse(**fields)
+    return make
+
+
+@pytest.fixture(scope="session")
+def category_factory():
+    """Build CategoryResponse objects with placeholder values for unspecified fields."""
+    def make(category_id: str = "1", **overrides) -> CategoryResponse:
+        fields = {"category_id": category_id, "category_name": f"Cat {category_id}"}
+        fields.update(overrides)
+        return CategoryResponse(**fields)
+    return make
+
+
 @pytest.fixture
 def sample_product_data():
     """Sample product data for testing."""
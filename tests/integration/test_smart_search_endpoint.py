@@ -5,10 +5,14 @@ import os
 import subprocess
 import time
 import sys
+import traceback
 
 API_BASE_URL = "http://localhost:8000"
 INTERNAL_KEY = os.getenv("INTERNAL_API_KEY", "ALIINSIDER-2025")
 
+# Tracebacks are only formatted with --verbose
+VERBOSE = "--verbose" in sys.argv
+
 
 def start_server():
     """Start the API server in the background."""
@@ -111,8 +115,8 @@ def test_smart_search_endpoint():
             
     except Exception as e:
         print(f"✗ FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            print(traceback.format_exc())
         return False
     
     print("\n")
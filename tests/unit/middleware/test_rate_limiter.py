@@ -1,7 +1,6 @@
 """Unit tests for EnhancedRateLimiter."""
 
 import pytest
-import time
 from src.middleware.rate_limiter import (
     RateLimitConfig,
     TokenBucket,
@@ -12,6 +11,25 @@ from src.middleware.rate_limiter import (
 )
 
 
+class FakeClock:
+    """Manually advanced monotonic clock for deterministic timing tests."""
+    
+    def __init__(self, start: float = 0.0):
+        self.t = start
+    
+    def __call__(self) -> float:
+        return self.t
+    
+    def advance(self, seconds: float) -> None:
+        self.t += seconds
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock for injection into rate limiter primitives."""
+    return FakeClock()
+
+
 class TestRateLimitConfig:
     """Test RateLimitConfig dataclass."""
     
@@ -55,9 +73,9 @@ class TestTokenBucket:
         assert bucket.capacity == 10
         assert bucket.tokens == 10.0
     
-    def test_consume_tokens(self):
+    def test_consume_tokens(self, clock):
         """Test consuming tokens."""
-        bucket = TokenBucket(rate=5.0, capacity=10)
+        bucket = TokenBucket(rate=5.0, capacity=10, time_func=clock)
         
         assert bucket.consume(1) is True
         assert bucket.tokens == 9.0
@@ -65,38 +83,39 @@ class TestTokenBucket:
         assert bucket.consume(5) is True
         assert bucket.tokens == 4.0
     
-    def test_consume_insufficient_tokens(self):
+    def test_consume_insufficient_tokens(self, clock):
         """Test consuming when insufficient tokens."""
-        bucket = TokenBucket(rate=5.0, capacity=10)
+        bucket = TokenBucket(rate=5.0, capacity=10, time_func=clock)
         
         assert bucket.consume(11) is False
         assert bucket.tokens == 10.0  # No tokens consumed
     
-    def test_token_refill(self):
+    def test_token_refill(self, clock):
         """Test token refill over time."""
-        bucket = TokenBucket(rate=10.0, capacity=10)
+        bucket = TokenBucket(rate=10.0, capacity=10, time_func=clock)
         
         # Consume all tokens
         bucket.consume(10)
         assert bucket.tokens == 0.0
         
-        # Wait for refill
-        time.sleep(0.5)
+        # Advance clock for refill
+        clock.advance(0.5)
         
-        # Should have ~5 tokens (10 tokens/sec * 0.5 sec)
+        # Should have 5 tokens (10 tokens/sec * 0.5 sec)
         assert bucket.consume(1) is True
+        assert bucket.tokens == 4.0
     
-    def test_get_retry_after(self):
+    def test_get_retry_after(self, clock):
         """Test retry-after calculation."""
-        bucket = TokenBucket(rate=10.0, capacity=10)
+        bucket = TokenBucket(rate=10.0, capacity=10, time_func=clock)
         
         # Consume all tokens
         bucket.consume(10)
         
         retry_after = bucket.get_retry_after()
         
-        # Should need ~0.1 seconds for 1 token at 10 tokens/sec
-        assert 0.05 <= retry_after <= 0.15
+        # Should need 0.1 seconds for 1 token at 10 tokens/sec
+        assert retry_after == pytest.approx(0.1)
 
 
 class TestSlidingWindowCounter:
@@ -108,7 +127,7 @@ class TestSlidingWindowCounter:
         
         assert window.limit == 10
         assert window.window_seconds == 60
-        assert len(window.timestamps) == 0
+        assert window.requests_in_window() == 0
     
     def test_is_allowed(self):
         """Test request allowance."""
@@ -121,41 +140,52 @@ class TestSlidingWindowCounter:
         # 6th request should be blocked
         assert window.is_allowed() is False
     
-    def test_window_expiration(self):
+    def test_is_allowed_bulk(self, clock):
+        """Test bulk requests are admitted only if all fit in the window."""
+        window = SlidingWindowCounter(limit=5, window_seconds=60, time_func=clock)
+        
+        assert window.is_allowed(3) is True
+        assert window.is_allowed(3) is False
+        assert window.is_allowed(2) is True
+        assert window.requests_in_window() == 5
+        assert window.is_allowed(6) is False
+    
+    def test_window_expiration(self, clock):
         """Test that old requests expire."""
-        window = SlidingWindowCounter(limit=2, window_seconds=1)
+        window = SlidingWindowCounter(limit=2, window_seconds=1, time_func=clock)
         
         # Use up limit
         assert window.is_allowed() is True
         assert window.is_allowed() is True
         assert window.is_allowed() is False
         
-        # Wait for window to expire
-        time.sleep(1.1)
+        # Advance clock past the window
+        clock.advance(1.1)
         
         # Should be allowed again
         assert window.is_allowed() is True
     
-    def test_get_retry_after(self):
+    def test_get_retry_after(self, clock):
         """Test retry-after calculation."""
-        window = SlidingWindowCounter(limit=2, window_seconds=2)
+        window = SlidingWindowCounter(limit=2, window_seconds=2, time_func=clock)
         
         # Use up limit
         window.is_allowed()
         window.is_allowed()
+        clock.advance(0.5)
         
         retry_after = window.get_retry_after()
         
-        # Should be close to window_seconds
-        assert 0 <= retry_after <= 2.1
+        # Oldest request expires after the remaining part of the window
+        assert retry_after == pytest.approx(1.5)
 
 
 class TestEnhancedRateLimiter:
     """Test EnhancedRateLimiter class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def rate_limiter(self):
-        """Create rate limiter for testing."""
+        """Create rate limiter shared by all tests in this class."""
         config = RateLimitConfig(
             rate_per_second=10.0,
             burst_size=20,
@@ -163,6 +193,14 @@ class TestEnhancedRateLimiter:
         )
         return EnhancedRateLimiter(config)
     
+    @pytest.fixture(autouse=True)
+    def reset_rate_limiter_state(self, rate_limiter):
+        """Clear per-client state and metrics before each test."""
+        rate_limiter.token_buckets.clear()
+        rate_limiter.sliding_windows.clear()
+        for key in rate_limiter.metrics:
+            rate_limiter.metrics[key] = 0
+    
     def test_initialization(self, rate_limiter):
         """Test rate limiter initialization."""
         assert rate_limiter.config.rate_per_second == 10.0
@@ -192,15 +230,54 @@ class TestEnhancedRateLimiter:
         """Test burst rate limiting."""
         client_id = "client-1"
         
-        # Should allow burst_size requests
-        for i in range(20):
-            is_allowed, _ = rate_limiter.is_allowed(client_id)
-            assert is_allowed is True
+        # Should allow burst_size requests in one acquisition
+        assert rate_limiter.try_acquire(client_id, 20)[0] is True
         
         # Next request should be rate limited
         is_allowed, retry_after = rate_limiter.is_allowed(client_id)
         assert is_allowed is False
         assert retry_after > 0
+        
+        assert rate_limiter.metrics['allowed_requests'] == 20
+        assert rate_limiter.metrics['blocked_requests'] == 1
+    
+    @pytest.mark.parametrize("burst_size, rate_per_minute", [(20, 100), (100, 20)])
+    def test_try_acquire_exceeding_limits(self, burst_size, rate_per_minute):
+        """Test bulk acquisition that can never succeed is refused outright."""
+        limiter = EnhancedRateLimiter(RateLimitConfig(
+            rate_per_second=10.0,
+            burst_size=burst_size,
+            rate_per_minute=rate_per_minute
+        ))
+        
+        with pytest.raises(ValueError):
+            limiter.try_acquire("client-1", 21)
+        
+        assert limiter.metrics['total_requests'] == 0
+        assert limiter.try_acquire("client-1", 20)[0] is True
+    
+    @pytest.mark.parametrize("tokens", [0, -1])
+    def test_try_acquire_rejects_non_positive_tokens(self, rate_limiter, tokens):
+        """Test non-positive token counts are rejected without touching state."""
+        with pytest.raises(ValueError):
+            rate_limiter.try_acquire("client-1", tokens)
+        
+        assert rate_limiter.metrics['total_requests'] == 0
+        assert "client-1" not in rate_limiter.token_buckets
+    
+    def test_get_status_uses_limiter_clock(self, clock):
+        """Test status refills tokens from the limiter's own clock."""
+        limiter = EnhancedRateLimiter(
+            RateLimitConfig(rate_per_second=1.0, burst_size=5, rate_per_minute=100),
+            time_func=clock
+        )
+        
+        assert limiter.try_acquire("client-1", 5)[0] is True
+        assert limiter.get_status("client-1")['tokens_available'] == 0
+        
+        clock.advance(3.0)
+        
+        assert limiter.get_status("client-1")['tokens_available'] == 3
     
     def test_get_status(self, rate_limiter):
         """Test getting rate limit status."""
@@ -247,6 +324,9 @@ class TestEnhancedRateLimiter:
 class TestGlobalRateLimiter:
     """Test global rate limiter singleton."""
     
+    # Mutates the module-level singleton; keep on one xdist worker
+    pytestmark = pytest.mark.xdist_group(name="global_rate_limiter")
+    
     def test_get_rate_limiter(self):
         """Test getting global rate limiter."""
         reset_rate_limiter()
@@ -1,5 +1,13 @@
 """Unit tests for response models."""
 
+import itertools
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from src.models import responses
 from src.models.responses import (
     CategoryResponse,
     ProductResponse,
@@ -9,118 +17,135 @@ from src.models.responses import (
     ServiceResponse
 )
 
+MINIMAL_PRODUCT = {
+    "product_id": "123",
+    "product_title": "Test Product",
+    "product_url": "https://example.com",
+    "price": "10.00",
+    "currency": "USD"
+}
+
+# (model class, constructor kwargs, expected attribute and to_dict() values)
+MODEL_CASES = [
+    (
+        CategoryResponse,
+        {"category_id": "123", "category_name": "Electronics", "parent_id": "456"},
+        {"category_id": "123", "category_name": "Electronics", "parent_id": "456"}
+    ),
+    (
+        CategoryResponse,
+        {"category_id": "123", "category_name": "Electronics"},
+        {"parent_id": None}
+    ),
+    (
+        ProductResponse,
+        {
+            "product_id": "1005003091506814",
+            "product_title": "Wireless Headphones",
+            "product_url": "https://example.com/product",
+            "price": "29.99",
+            "currency": "USD",
+            "image_url": "https://example.com/image.jpg",
+            "commission_rate": "5.0"
+        },
+        {
+            "product_id": "1005003091506814",
+            "product_title": "Wireless Headphones",
+            "product_url": "https://example.com/product",
+            "price": "29.99",
+            "currency": "USD",
+            "commission_rate": "5.0"
+        }
+    ),
+    (
+        ProductResponse,
+        MINIMAL_PRODUCT,
+        {"image_url": None, "commission_rate": None, "original_price": None}
+    ),
+    (
+        AffiliateLink,
+        {
+            "original_url": "https://www.aliexpress.com/item/123.html",
+            "affiliate_url": "https://s.click.aliexpress.com/e/_affiliate",
+            "tracking_id": "test_tracking",
+            "commission_rate": "5.0"
+        },
+        {
+            "original_url": "https://www.aliexpress.com/item/123.html",
+            "affiliate_url": "https://s.click.aliexpress.com/e/_affiliate",
+            "tracking_id": "test_tracking",
+            "commission_rate": "5.0"
+        }
+    ),
+]
+MODEL_CASE_IDS = [
+    "category",
+    "category_without_parent",
+    "product",
+    "product_minimal",
+    "affiliate_link",
+]
+
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def deterministic_response_metadata():
+    """Give ServiceResponse sequential request IDs and a fixed clock instead of uuid4/now."""
+    request_ids = itertools.count(1)
+    fake_uuid = SimpleNamespace(uuid4=lambda: uuid.UUID(int=next(request_ids)))
+    fake_datetime = SimpleNamespace(now=lambda tz=None: FROZEN_NOW)
+    with patch.object(responses, "uuid", fake_uuid), patch.object(responses, "datetime", fake_datetime):
+        yield
+
+
+@pytest.fixture(scope="module")
+def service_responses(category_factory):
+    """Build the ServiceResponse objects under test once; tests only read them."""
+    return {
+        "ok_dict": ServiceResponse.success_response(
+            data={"message": "Success"},
+            metadata={"custom": "metadata"}
+        ),
+        "error": ServiceResponse.error_response(
+            error="Something went wrong",
+            metadata={"error_code": "E001"}
+        ),
+        "ok_model": ServiceResponse.success_response(
+            data=category_factory("123", category_name="Test Category")
+        ),
+        "ok_list": ServiceResponse.success_response(
+            data=[category_factory("1"), category_factory("2")]
+        ),
+    }
+
+
+def assert_subset(data, expected):
+    """Assert data has the expected value for every key in expected."""
+    assert {key: data.get(key) for key in expected} == expected
+
+
+def assert_attributes(model, expected):
+    """Assert model has the expected value for every attribute in expected."""
+    assert {key: getattr(model, key) for key in expected} == expected
+
 
 class TestResponseModels:
     """Test response model functionality."""
     
-    def test_category_response_creation(self):
-        """Test CategoryResponse creation and serialization."""
-        category = CategoryResponse(
-            category_id="123",
-            category_name="Electronics",
-            parent_id="456"
-        )
+    @pytest.mark.parametrize("model_cls,kwargs,expected", MODEL_CASES, ids=MODEL_CASE_IDS)
+    def test_model_roundtrip(self, model_cls, kwargs, expected):
+        """Test model creation and serialization keep every field."""
+        model = model_cls(**kwargs)
         
-        assert category.category_id == "123"
-        assert category.category_name == "Electronics"
-        assert category.parent_id == "456"
+        assert_attributes(model, expected)
         
         # Test serialization
-        data = category.to_dict()
-        assert data['category_id'] == "123"
-        assert data['category_name'] == "Electronics"
-        assert data['parent_id'] == "456"
+        assert_subset(model.to_dict(), expected)
     
-    def test_category_response_without_parent(self):
-        """Test CategoryResponse without parent ID."""
-        category = CategoryResponse(
-            category_id="123",
-            category_name="Electronics"
-        )
-        
-        assert category.parent_id is None
-        
-        data = category.to_dict()
-        assert data['parent_id'] is None
-    
-    def test_product_response_creation(self):
-        """Test ProductResponse creation and serialization."""
-        product = ProductResponse(
-            product_id="1005003091506814",
-            product_title="Wireless Headphones",
-            product_url="https://example.com/product",
-            price="29.99",
-            currency="USD",
-            image_url="https://example.com/image.jpg",
-            commission_rate="5.0"
-        )
-        
-        assert product.product_id == "1005003091506814"
-        assert product.product_title == "Wireless Headphones"
-        assert product.price == "29.99"
-        assert product.currency == "USD"
-        
-        # Test serialization
-        data = product.to_dict()
-        assert data['product_id'] == "1005003091506814"
-        assert data['product_url'] == "https://example.com/product"
-        assert data['commission_rate'] == "5.0"
-    
-    def test_product_response_minimal(self):
-        """Test ProductResponse with minimal required fields."""
-        product = ProductResponse(
-            product_id="123",
-            product_title="Test Product",
-            product_url="https://example.com",
-            price="10.00",
-            currency="USD"
-        )
-        
-        assert product.image_url is None
-        assert product.commission_rate is None
-        assert product.original_price is None
-        
-        data = product.to_dict()
-        assert data['image_url'] is None
-        assert data['commission_rate'] is None
-    
-    def test_affiliate_link_creation(self):
-        """Test AffiliateLink creation and serialization."""
-        link = AffiliateLink(
-            original_url="https://www.aliexpress.com/item/123.html",
-            affiliate_url="https://s.click.aliexpress.com/e/_affiliate",
-            tracking_id="test_tracking",
-            commission_rate="5.0"
-        )
-        
-        assert link.original_url == "https://www.aliexpress.com/item/123.html"
-        assert link.affiliate_url == "https://s.click.aliexpress.com/e/_affiliate"
-        assert link.tracking_id == "test_tracking"
-        assert link.commission_rate == "5.0"
-        
-        # Test serialization
-        data = link.to_dict()
-        assert data['original_url'] == "https://www.aliexpress.com/item/123.html"
-        assert data['tracking_id'] == "test_tracking"
-    
-    def test_product_search_response_creation(self):
+    def test_product_search_response_creation(self, product_factory):
         """Test ProductSearchResponse creation and serialization."""
-        products = [
-            ProductResponse(
-                product_id="1",
-                product_title="Product 1",
-                product_url="https://example.com/1",
-                price="10.00",
-                currency="USD"
-            ),
-            ProductResponse(
-                product_id="2",
-                product_title="Product 2",
-                product_url="https://example.com/2",
-                price="20.00",
-                currency="USD"
-            )
-        ]
+        products = [product_factory("1"), product_factory("2", price="20.00")]
         
         search_response = ProductSearchResponse(
             products=products,
@@ -129,29 +154,18 @@ class TestResponseModels:
             page_size=20
         )
         
+        expected = {'total_record_count': 100, 'current_page': 1, 'page_size': 20}
         assert len(search_response.products) == 2
-        assert search_response.total_record_count == 100
-        assert search_response.current_page == 1
-        assert search_response.page_size == 20
+        assert_attributes(search_response, expected)
         
         # Test serialization
         data = search_response.to_dict()
         assert len(data['products']) == 2
-        assert data['total_record_count'] == 100
-        assert data['current_page'] == 1
-        assert data['page_size'] == 20
+        assert_subset(data, expected)
     
-    def test_hot_product_response_creation(self):
+    def test_hot_product_response_creation(self, product_factory):
         """Test HotProductResponse creation and serialization."""
-        products = [
-            ProductResponse(
-                product_id="1",
-                product_title="Hot Product",
-                product_url="https://example.com/hot",
-                price="15.00",
-                currency="USD"
-            )
-        ]
+        products = [product_factory("1", product_title="Hot Product", price="15.00")]
         
         hot_response = HotProductResponse(
             products=products,
@@ -166,35 +180,28 @@ class TestResponseModels:
         assert len(data['products']) == 1
         assert data['total_count'] == 50
     
-    def test_service_response_success(self):
+    def test_service_response_success(self, service_responses):
         """Test ServiceResponse success creation."""
         test_data = {"message": "Success"}
-        response = ServiceResponse.success_response(
-            data=test_data,
-            metadata={"custom": "metadata"}
-        )
+        response = service_responses["ok_dict"]
         
         assert response.success is True
         assert response.data == test_data
         assert response.error is None
         assert "custom" in response.metadata
         assert "request_id" in response.metadata
-        assert "timestamp" in response.metadata
+        assert response.metadata["timestamp"] == "2024-01-01T00:00:00Z"
         
         # Test serialization
         data = response.to_dict()
-        assert data['success'] is True
-        assert data['data'] == test_data
+        assert_subset(data, {'success': True, 'data': test_data})
         assert 'error' not in data
         assert data['metadata']['custom'] == "metadata"
     
-    def test_service_response_error(self):
+    def test_service_response_error(self, service_responses):
         """Test ServiceResponse error creation."""
         error_message = "Something went wrong"
-        response = ServiceResponse.error_response(
-            error=error_message,
-            metadata={"error_code": "E001"}
-        )
+        response = service_responses["error"]
         
         assert response.success is False
         assert response.data is None
@@ -204,37 +211,21 @@ class TestResponseModels:
         
         # Test serialization
         data = response.to_dict()
-        assert data['success'] is False
-        assert data['error'] == error_message
+        assert_subset(data, {'success': False, 'error': error_message})
         assert 'data' not in data
         assert data['metadata']['error_code'] == "E001"
     
-    def test_service_response_with_model_data(self):
+    def test_service_response_with_model_data(self, service_responses):
         """Test ServiceResponse with model data."""
-        category = CategoryResponse(
-            category_id="123",
-            category_name="Test Category"
-        )
-        
-        response = ServiceResponse.success_response(data=category)
-        
         # Test serialization handles model data
-        data = response.to_dict()
+        data = service_responses["ok_model"].to_dict()
         assert data['success'] is True
-        assert data['data']['category_id'] == "123"
-        assert data['data']['category_name'] == "Test Category"
+        assert_subset(data['data'], {'category_id': "123", 'category_name': "Test Category"})
     
-    def test_service_response_with_list_data(self):
+    def test_service_response_with_list_data(self, service_responses):
         """Test ServiceResponse with list of models."""
-        categories = [
-            CategoryResponse(category_id="1", category_name="Cat 1"),
-            CategoryResponse(category_id="2", category_name="Cat 2")
-        ]
-        
-        response = ServiceResponse.success_response(data=categories)
-        
         # Test serialization handles list of models
-        data = response.to_dict()
+        data = service_responses["ok_list"].to_dict()
         assert data['success'] is True
         assert len(data['data']) == 2
         assert data['data'][0]['category_id'] == "1"
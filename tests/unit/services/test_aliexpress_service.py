@@ -11,17 +11,38 @@ from src.exceptions import (
 )
 from src.models.responses import CategoryResponse, ProductResponse, AffiliateLink
 
+# Over the per-call limits of get_products_details (20) and get_affiliate_links (50)
+TOO_MANY_PRODUCT_IDS = [f"id_{i}" for i in range(25)]
+TOO_MANY_URLS = [f"https://example.com/item/{i}" for i in range(55)]
+
+# promotion_link returned by the mock SDK client in conftest
+EXPECTED_AFFILIATE_URL = "https://s.click.aliexpress.com/e/_test_affiliate_link"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def sdk_api_class():
+    """Patch the AliExpress SDK client once for every test in this module."""
+    with patch('src.services.aliexpress_service.AliexpressApi') as api_class:
+        yield api_class
+
+
+@pytest.fixture(autouse=True)
+def reset_api_mock(mock_aliexpress_service):
+    """Clear calls and side effects left on the session-scoped API mock."""
+    yield
+    mock_aliexpress_service.api.reset_mock(side_effect=True)
+
 
 class TestAliExpressService:
     """Test AliExpress service functionality."""
     
-    def test_service_initialization(self, test_config):
+    def test_service_initialization(self, test_config, sdk_api_class):
         """Test service initialization."""
-        with patch('src.services.aliexpress_service.AliexpressApi') as mock_api_class:
-            service = AliExpressService(test_config)
-            
-            assert service.config == test_config
-            mock_api_class.assert_called_once()
+        sdk_api_class.reset_mock()
+        service = AliExpressService(test_config)
+        
+        assert service.config == test_config
+        sdk_api_class.assert_called_once()
     
     def test_get_parent_categories_success(self, mock_aliexpress_service):
         """Test successful parent categories retrieval."""
@@ -32,9 +53,11 @@ class TestAliExpressService:
         assert categories[0].category_id == "123"
         assert categories[0].category_name == "Electronics"
     
-    def test_get_parent_categories_api_error(self, mock_aliexpress_service):
+    def test_get_parent_categories_api_error(self, mock_aliexpress_service, monkeypatch):
         """Test parent categories retrieval with API error."""
-        mock_aliexpress_service.api.get_parent_categories.side_effect = Exception("API Error")
+        monkeypatch.setattr(
+            mock_aliexpress_service.api.get_parent_categories, "side_effect", Exception("API Error")
+        )
         
         with pytest.raises(APIError, match="API call failed for parent_categories"):
             mock_aliexpress_service.get_parent_categories()
@@ -48,11 +71,6 @@ class TestAliExpressService:
         assert categories[0].category_id == "123"
         assert categories[0].parent_id == "123"
     
-    def test_get_child_categories_empty_parent_id(self, mock_aliexpress_service):
-        """Test child categories with empty parent ID."""
-        with pytest.raises(ValidationError, match="parent_id cannot be empty"):
-            mock_aliexpress_service.get_child_categories("")
-    
     def test_search_products_success(self, mock_aliexpress_service):
         """Test successful product search."""
         result = mock_aliexpress_service.search_products(
@@ -65,16 +83,6 @@ class TestAliExpressService:
         assert isinstance(result.products[0], ProductResponse)
         assert result.products[0].product_id == "1005003091506814"
     
-    def test_search_products_invalid_page_size(self, mock_aliexpress_service):
-        """Test product search with invalid page size."""
-        with pytest.raises(ValidationError, match="page_size cannot exceed 50"):
-            mock_aliexpress_service.search_products(page_size=100)
-    
-    def test_search_products_invalid_page_no(self, mock_aliexpress_service):
-        """Test product search with invalid page number."""
-        with pytest.raises(ValidationError, match="page_no must be at least 1"):
-            mock_aliexpress_service.search_products(page_no=0)
-    
     def test_get_products_details_success(self, mock_aliexpress_service):
         """Test successful product details retrieval."""
         product_ids = ["1005003091506814"]
@@ -83,18 +91,6 @@ class TestAliExpressService:
         assert len(results) == 1
         assert results[0].product_id == "1005003091506814"
     
-    def test_get_products_details_empty_list(self, mock_aliexpress_service):
-        """Test product details with empty product IDs."""
-        with pytest.raises(ValidationError, match="product_ids cannot be empty"):
-            mock_aliexpress_service.get_products_details([])
-    
-    def test_get_products_details_too_many_ids(self, mock_aliexpress_service):
-        """Test product details with too many product IDs."""
-        product_ids = [f"id_{i}" for i in range(25)]
-        
-        with pytest.raises(ValidationError, match="Cannot request details for more than 20 products"):
-            mock_aliexpress_service.get_products_details(product_ids)
-    
     def test_get_affiliate_links_success(self, mock_aliexpress_service):
         """Test successful affiliate link generation."""
         urls = ["https://www.aliexpress.com/item/1005003091506814.html"]
@@ -103,46 +99,43 @@ class TestAliExpressService:
         assert len(results) == 1
         assert isinstance(results[0], AffiliateLink)
         assert results[0].original_url == "https://www.aliexpress.com/item/1005003091506814.html"
-        assert "affiliate" in results[0].affiliate_url
-    
-    def test_get_affiliate_links_empty_list(self, mock_aliexpress_service):
-        """Test affiliate links with empty URL list."""
-        with pytest.raises(ValidationError, match="urls cannot be empty"):
-            mock_aliexpress_service.get_affiliate_links([])
-    
-    def test_get_affiliate_links_too_many_urls(self, mock_aliexpress_service):
-        """Test affiliate links with too many URLs."""
-        urls = [f"https://example.com/item/{i}" for i in range(55)]
-        
-        with pytest.raises(ValidationError, match="Cannot process more than 50 URLs"):
-            mock_aliexpress_service.get_affiliate_links(urls)
-    
-    def test_handle_api_error_permission_error(self, mock_aliexpress_service):
-        """Test API error handling for permission errors."""
-        error = Exception("App does not have permission to access this resource")
-        
-        with pytest.raises(PermanentError):
-            mock_aliexpress_service._handle_api_error(error, "test_operation")
-    
-    def test_handle_api_error_rate_limit_error(self, mock_aliexpress_service):
-        """Test API error handling for rate limit errors."""
-        error = Exception("Rate limit exceeded")
-        
-        with pytest.raises(RateLimitError):
-            mock_aliexpress_service._handle_api_error(error, "test_operation")
-    
-    def test_handle_api_error_validation_error(self, mock_aliexpress_service):
-        """Test API error handling for validation errors."""
-        error = Exception("Invalid parameter provided")
-        
-        with pytest.raises(ValidationError):
-            mock_aliexpress_service._handle_api_error(error, "test_operation")
-    
-    def test_handle_api_error_generic_error(self, mock_aliexpress_service):
-        """Test API error handling for generic errors."""
-        error = Exception("Unknown error occurred")
+        assert results[0].affiliate_url == EXPECTED_AFFILIATE_URL
+    
+    @pytest.mark.parametrize("method_name,kwargs,match", [
+        ("get_child_categories", {"parent_id": ""}, "parent_id cannot be empty"),
+        ("search_products", {"page_size": 100}, "page_size cannot exceed 50"),
+        ("search_products", {"page_no": 0}, "page_no must be at least 1"),
+        ("get_products_details", {"product_ids": []}, "product_ids cannot be empty"),
+        ("get_products_details", {"product_ids": TOO_MANY_PRODUCT_IDS},
+         "Cannot request details for more than 20 products"),
+        ("get_affiliate_links", {"urls": []}, "urls cannot be empty"),
+        ("get_affiliate_links", {"urls": TOO_MANY_URLS},
+         "Cannot process more than 50 URLs"),
+    ], ids=[
+        "child_categories_empty_parent_id",
+        "search_products_invalid_page_size",
+        "search_products_invalid_page_no",
+        "products_details_empty_list",
+        "products_details_too_many_ids",
+        "affiliate_links_empty_list",
+        "affiliate_links_too_many_urls",
+    ])
+    def test_validation_errors(self, mock_aliexpress_service, method_name, kwargs, match):
+        """Test invalid arguments are rejected before calling the API."""
+        with pytest.raises(ValidationError, match=match):
+            getattr(mock_aliexpress_service, method_name)(**kwargs)
+    
+    @pytest.mark.parametrize("message,expected_exception", [
+        ("App does not have permission to access this resource", PermanentError),
+        ("Rate limit exceeded", RateLimitError),
+        ("Invalid parameter provided", ValidationError),
+        ("Unknown error occurred", APIError),
+    ], ids=["permission_error", "rate_limit_error", "validation_error", "generic_error"])
+    def test_handle_api_error(self, mock_aliexpress_service, message, expected_exception):
+        """Test API error handling maps error messages to exception types."""
+        error = Exception(message)
         
-        with pytest.raises(APIError):
+        with pytest.raises(expected_exception):
             mock_aliexpress_service._handle_api_error(error, "test_operation")
     
     def test_get_permission_guidance(self, mock_aliexpress_service):
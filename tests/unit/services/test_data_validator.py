@@ -1,7 +1,15 @@
 """Unit tests for DataValidator."""
 
 import pytest
-from src.services.data_validator import ProductDataValidator, SearchResultValidator
+from src.services.data_validator import (
+    ProductDataValidator,
+    SearchResultValidator,
+    ISSUE_CURRENCY_INVALID,
+    ISSUE_PRICE_INVALID,
+    ISSUE_PRODUCT_ID_MISSING,
+    ISSUE_TITLE_TOO_SHORT,
+    ISSUE_URL_INVALID
+)
 from src.models.responses import ProductResponse
 
 
@@ -35,7 +43,7 @@ class TestProductDataValidator:
         is_valid, issues = ProductDataValidator.validate_product(valid_product)
         
         assert is_valid is False
-        assert any("product_id" in issue.lower() for issue in issues)
+        assert ISSUE_PRODUCT_ID_MISSING in issues
     
     def test_validate_short_title(self, valid_product):
         """Test validation with short title."""
@@ -44,7 +52,7 @@ class TestProductDataValidator:
         is_valid, issues = ProductDataValidator.validate_product(valid_product)
         
         assert is_valid is False
-        assert any("title too short" in issue.lower() for issue in issues)
+        assert ISSUE_TITLE_TOO_SHORT in issues
     
     def test_validate_invalid_url(self, valid_product):
         """Test validation with invalid URL."""
@@ -53,7 +61,7 @@ class TestProductDataValidator:
         is_valid, issues = ProductDataValidator.validate_product(valid_product)
         
         assert is_valid is False
-        assert any("url" in issue.lower() for issue in issues)
+        assert ISSUE_URL_INVALID in issues
     
     def test_validate_invalid_price(self, valid_product):
         """Test validation with invalid price."""
@@ -62,7 +70,7 @@ class TestProductDataValidator:
         is_valid, issues = ProductDataValidator.validate_product(valid_product)
         
         assert is_valid is False
-        assert any("price" in issue.lower() for issue in issues)
+        assert ISSUE_PRICE_INVALID in issues
     
     def test_validate_invalid_currency(self, valid_product):
         """Test validation with invalid currency."""
@@ -71,7 +79,35 @@ class TestProductDataValidator:
         is_valid, issues = ProductDataValidator.validate_product(valid_product)
         
         assert is_valid is False
-        assert any("currency" in issue.lower() for issue in issues)
+        assert ISSUE_CURRENCY_INVALID in issues
+    
+    @pytest.mark.parametrize("currency", ['UAH', 'MXN', 'TRY', 'INR', 'IDR', 'SEK', 'KRW'])
+    def test_validate_accepts_configurable_currencies(self, valid_product, currency):
+        """Test currencies accepted by Config pass product validation."""
+        valid_product.currency = currency
+        
+        is_valid, issues = ProductDataValidator.validate_product(valid_product)
+        
+        assert is_valid is True, issues
+    
+    def test_validate_repeated_product_returns_fresh_issues(self, valid_product):
+        """Test memoized validation does not share the issues list between calls."""
+        valid_product.currency = "XXX"
+        
+        _, first_issues = ProductDataValidator.validate_product(valid_product)
+        first_issues.clear()
+        _, second_issues = ProductDataValidator.validate_product(valid_product)
+        
+        assert ISSUE_CURRENCY_INVALID in second_issues
+    
+    def test_validate_unhashable_field(self, valid_product):
+        """Test malformed unhashable fields are reported instead of raising."""
+        valid_product.product_url = ["x"]
+        
+        is_valid, issues = ProductDataValidator.validate_product(valid_product)
+        
+        assert is_valid is False
+        assert issues == [ISSUE_URL_INVALID]
     
     def test_sanitize_product(self, valid_product):
         """Test product sanitization."""
@@ -94,6 +130,19 @@ class TestProductDataValidator:
         assert is_valid is True
         assert sanitized.product_title == "Test Product"
     
+    def test_validate_and_sanitize_normalizes_valid_product(self, valid_product):
+        """Test valid but unnormalized fields are still sanitized."""
+        valid_product.currency = "usd"
+        valid_product.price = "29.9"
+        valid_product.commission_rate = "5%"
+        
+        sanitized, is_valid, issues = ProductDataValidator.validate_and_sanitize(valid_product)
+        
+        assert is_valid is True
+        assert sanitized.currency == "USD"
+        assert sanitized.price == "29.90"
+        assert sanitized.commission_rate == "5.0%"
+    
     def test_filter_valid_products(self):
         """Test filtering valid products."""
         products = [
@@ -136,6 +185,7 @@ class TestProductDataValidator:
         assert not ProductDataValidator._is_valid_url("not-a-url")
         assert not ProductDataValidator._is_valid_url("")
         assert not ProductDataValidator._is_valid_url(None)
+        assert not ProductDataValidator._is_valid_url(["https://example.com"])
 
 
 class TestSearchResultValidator:
@@ -171,6 +221,7 @@ class TestSearchResultValidator:
         
         assert len(unique) == 2
         assert unique[0].product_id == "1005001"
+        assert unique[0].product_title == "Product 1"  # First occurrence kept
         assert unique[1].product_id == "1005002"
     
     def test_apply_quality_filters_commission_rate(self):
@@ -230,3 +281,21 @@ class TestSearchResultValidator:
         
         assert len(filtered) == 1
         assert filtered[0].product_id == "1005001"
+    
+    def test_apply_quality_filters_without_filters(self):
+        """Test no filters returns every product in a new list."""
+        products = [
+            ProductResponse(
+                product_id="1005001",
+                product_title="No Image",
+                product_url="https://example.com/1",
+                price="29.99",
+                currency="USD",
+                commission_rate="invalid"
+            )
+        ]
+        
+        filtered = SearchResultValidator.apply_quality_filters(products)
+        
+        assert filtered == products
+        assert filtered is not products
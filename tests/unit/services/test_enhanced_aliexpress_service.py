@@ -1,7 +1,7 @@
 """Unit tests for EnhancedAliExpressService with smart search functionality."""
 
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import patch
 from datetime import datetime
 
 from src.services.enhanced_aliexpress_service import (
@@ -42,19 +42,42 @@ def test_cache_config():
     )
 
 
+class FakeCacheService:
+    """In-memory stand-in for CacheService returning preset results.
+    
+    Plain coroutines avoid AsyncMock's per-call bookkeeping; set
+    ``search_result`` to simulate a cache hit.
+    """
+    
+    def __init__(self):
+        self.search_result = None
+    
+    async def get_cached_search_result(self, *args, **kwargs):
+        return self.search_result
+    
+    async def cache_search_result(self, *args, **kwargs):
+        pass
+    
+    async def get_cached_affiliate_links(self, *args, **kwargs):
+        return [], []
+    
+    async def cache_affiliate_links(self, *args, **kwargs):
+        pass
+    
+    async def cleanup_expired_cache(self):
+        pass
+    
+    def get_cache_stats(self):
+        return {
+            'hit_rate_percentage': 0,
+            'api_calls_saved': 0
+        }
+
+
 @pytest.fixture
 def mock_cache_service():
-    """Create a mock cache service."""
-    cache_service = AsyncMock()
-    cache_service.get_cached_search_result = AsyncMock(return_value=None)
-    cache_service.cache_search_result = AsyncMock()
-    cache_service.get_cached_affiliate_links = AsyncMock(return_value=([], []))
-    cache_service.cache_affiliate_links = AsyncMock()
-    cache_service.get_cache_stats = Mock(return_value={
-        'hit_rate_percentage': 0,
-        'api_calls_saved': 0
-    })
-    return cache_service
+    """Create a stub cache service with an empty cache."""
+    return FakeCacheService()
 
 
 @pytest.fixture
@@ -82,6 +105,21 @@ def sample_products():
     ]
 
 
+@pytest.fixture(scope="module")
+def product_pool():
+    """Build the largest product list once; tests slice the count they need."""
+    return [
+        ProductResponse(
+            product_id=f"100500{i}",
+            product_title=f"Test Product {i}",
+            product_url=f"https://www.aliexpress.com/item/100500{i}.html",
+            price="29.99",
+            currency="USD"
+        )
+        for i in range(20)
+    ]
+
+
 @pytest.fixture
 def enhanced_service(test_config, test_cache_config, mock_cache_service):
     """Create an enhanced AliExpress service with mocked cache."""
@@ -169,7 +207,7 @@ class TestSmartProductSearch:
             'total_record_count': 2,
             'cached_at': datetime.utcnow()
         }
-        mock_cache_service.get_cached_search_result = AsyncMock(return_value=cached_data)
+        mock_cache_service.search_result = cached_data
         
         result = await enhanced_service.smart_product_search(
             keywords="test",
@@ -202,7 +240,7 @@ class TestSmartProductSearch:
             'total_record_count': 2,
             'cached_at': datetime.utcnow()
         }
-        mock_cache_service.get_cached_search_result = AsyncMock(return_value=cached_data)
+        mock_cache_service.search_result = cached_data
         
         # Mock fresh API call
         mock_search_result = ProductSearchResponse(
@@ -228,42 +266,54 @@ class TestSmartProductSearch:
             assert result.api_calls_saved == 0
     
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("product_count", [1, 5, 10, 20], ids=lambda n: f"{n}_products")
     async def test_metric_accuracy_with_multiple_products(
-        self, enhanced_service
+        self, enhanced_service, product_pool, product_count
     ):
         """Test that metrics are accurate with various product counts."""
-        for product_count in [1, 5, 10, 20]:
-            products = [
-                ProductResponse(
-                    product_id=f"100500{i}",
-                    product_title=f"Test Product {i}",
-                    product_url=f"https://www.aliexpress.com/item/100500{i}.html",
-                    price="29.99",
-                    currency="USD"
-                )
-                for i in range(product_count)
-            ]
-            
-            mock_search_result = ProductSearchResponse(
-                products=products,
-                total_record_count=product_count,
-                current_page=1,
+        mock_search_result = ProductSearchResponse(
+            products=product_pool[:product_count],
+            total_record_count=product_count,
+            current_page=1,
+            page_size=20
+        )
+        
+        with patch.object(
+            enhanced_service, 'get_products', return_value=mock_search_result
+        ):
+            result = await enhanced_service.smart_product_search(
+                keywords="test",
+                page_no=1,
                 page_size=20
             )
             
-            with patch.object(
-                enhanced_service, 'get_products', return_value=mock_search_result
-            ):
-                result = await enhanced_service.smart_product_search(
-                    keywords="test",
-                    page_no=1,
-                    page_size=20
-                )
-                
-                # Verify metrics match product count
-                assert result.affiliate_links_generated == product_count
-                assert result.affiliate_links_cached == 0
-                assert len(result.products) == product_count
+            # Verify metrics match product count
+            assert result.affiliate_links_generated == product_count
+            assert result.affiliate_links_cached == 0
+            assert len(result.products) == product_count
+    
+    @pytest.mark.asyncio
+    async def test_products_share_generated_at(self, enhanced_service, product_pool):
+        """Test that one search stamps all products with the same timestamp."""
+        mock_search_result = ProductSearchResponse(
+            products=product_pool[:5],
+            total_record_count=5,
+            current_page=1,
+            page_size=20
+        )
+        
+        with patch.object(
+            enhanced_service, 'get_products', return_value=mock_search_result
+        ):
+            result = await enhanced_service.smart_product_search(
+                keywords="test",
+                page_no=1,
+                page_size=20
+            )
+        
+        generated_at = {p.generated_at for p in result.products}
+        assert len(generated_at) == 1
+        assert None not in generated_at
     
     @pytest.mark.asyncio
     async def test_response_time_tracking(self, enhanced_service, sample_products):
@@ -394,6 +444,21 @@ class TestSmartSearchResponseDataclass:
         assert response.api_calls_saved == 0
         assert response.response_time_ms == 0
     
+    def test_to_dict_reflects_later_changes(self):
+        """Test that each serialization returns a fresh, current dict."""
+        response = SmartSearchResponse(
+            products=[],
+            total_record_count=0,
+            current_page=1,
+            page_size=20
+        )
+        
+        first = response.to_dict()
+        response.total_record_count = 5
+        
+        assert response.to_dict() is not first
+        assert response.to_dict()['total_record_count'] == 5
+    
     def test_custom_values(self):
         """Test that SmartSearchResponse accepts custom values."""
         now = datetime.utcnow()
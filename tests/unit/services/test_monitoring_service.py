@@ -1,5 +1,8 @@
 """Unit tests for MonitoringService."""
 
+import sys
+from unittest.mock import patch
+
 import pytest
 from datetime import datetime
 from src.services.monitoring_service import (
@@ -32,13 +35,12 @@ class TestPerformanceMetrics:
     
     def test_to_dict(self):
         """Test metrics serialization."""
-        now = datetime.utcnow()
         metrics = PerformanceMetrics(
             endpoint="/test",
             response_time_ms=100.0,
             cache_hit=False,
             api_calls_made=1,
-            timestamp=now,
+            timestamp=datetime.utcnow(),
             request_id="req-1"
         )
         
@@ -48,6 +50,24 @@ class TestPerformanceMetrics:
         assert result['response_time_ms'] == 100.0
         assert result['cache_hit'] is False
         assert result['request_id'] == "req-1"
+    
+    def test_labels_are_interned(self):
+        """Test endpoint and error type strings are shared across metrics."""
+        endpoint = "".join(["/api/", "products"])
+        error_type = "".join(["Timeout", "Error"])
+        metrics = PerformanceMetrics(
+            endpoint=endpoint,
+            response_time_ms=100.0,
+            cache_hit=False,
+            api_calls_made=1,
+            timestamp=datetime.utcnow(),
+            request_id="req-1",
+            status_code=504,
+            error_type=error_type
+        )
+        
+        assert metrics.endpoint is sys.intern("/api/products")
+        assert metrics.error_type is sys.intern("TimeoutError")
 
 
 class TestAggregatedStats:
@@ -152,6 +172,32 @@ class TestMonitoringService:
         assert stats['cache']['misses'] == 5
         assert stats['cache']['hit_rate'] == 50.0
     
+    def test_get_stats_percentiles_follow_new_requests(self, monitoring_service):
+        """Test repeated stats reads reflect requests recorded in between."""
+        for i, response_time in enumerate([100.0, 200.0]):
+            monitoring_service.record_request(PerformanceMetrics(
+                endpoint="/test",
+                response_time_ms=response_time,
+                cache_hit=True,
+                api_calls_made=0,
+                timestamp=datetime.utcnow(),
+                request_id=f"req-{i}"
+            ))
+        
+        assert monitoring_service.get_stats()['response_time']['p99_ms'] == 200.0
+        assert monitoring_service.get_stats()['response_time']['p99_ms'] == 200.0
+        
+        monitoring_service.record_request(PerformanceMetrics(
+            endpoint="/test",
+            response_time_ms=900.0,
+            cache_hit=True,
+            api_calls_made=0,
+            timestamp=datetime.utcnow(),
+            request_id="req-2"
+        ))
+        
+        assert monitoring_service.get_stats()['response_time']['p99_ms'] == 900.0
+    
     def test_get_recent_requests(self, monitoring_service):
         """Test getting recent requests."""
         # Record requests
@@ -169,6 +215,26 @@ class TestMonitoringService:
         recent = monitoring_service.get_recent_requests(limit=3)
         
         assert len(recent) == 3
+        assert [r['request_id'] for r in recent] == ["req-2", "req-3", "req-4"]
+    
+    def test_metrics_serialized_only_on_read(self, monitoring_service):
+        """Test recording never serializes and reads serialize only returned items."""
+        with patch.object(PerformanceMetrics, 'to_dict', autospec=True, return_value={}) as to_dict:
+            for i in range(5):
+                monitoring_service.record_request(PerformanceMetrics(
+                    endpoint="/test",
+                    response_time_ms=100.0,
+                    cache_hit=True,
+                    api_calls_made=0,
+                    timestamp=datetime.utcnow(),
+                    request_id=f"req-{i}"
+                ))
+            
+            assert to_dict.call_count == 0
+            
+            monitoring_service.get_recent_requests(limit=2)
+            
+            assert to_dict.call_count == 2
     
     def test_get_slow_requests(self, monitoring_service):
         """Test getting slow requests."""
@@ -188,6 +254,27 @@ class TestMonitoringService:
         
         assert len(slow) == 2  # 2 requests > 1000ms
     
+    def test_get_slow_requests_matches_buffer(self, monitoring_service):
+        """Test slow requests are limited to the buffered window and thresholds."""
+        # Every third request is slow; the first 50 leave the 100-entry buffer
+        for i in range(150):
+            monitoring_service.record_request(PerformanceMetrics(
+                endpoint="/test",
+                response_time_ms=2000.0 + i if i % 3 == 0 else 500.0,
+                cache_hit=True,
+                api_calls_made=0,
+                timestamp=datetime.utcnow(),
+                request_id=f"req-{i}"
+            ))
+        
+        for threshold in (None, 400.0, 2100.0):
+            expected = [
+                m.request_id for m in monitoring_service.metrics_buffer
+                if m.response_time_ms > (threshold or 1000)
+            ]
+            slow = monitoring_service.get_slow_requests(threshold_ms=threshold)
+            assert [r['request_id'] for r in slow] == expected
+    
     def test_reset_stats(self, monitoring_service):
         """Test resetting statistics."""
         # Record some requests
@@ -225,6 +312,32 @@ class TestMonitoringService:
         
         # Buffer should be limited to 100
         assert len(monitoring_service.metrics_buffer) == 100
+    
+    def test_record_batch_matches_record_request(self, monitoring_service):
+        """Test a batch leaves the same state as recording requests one by one."""
+        batch = [
+            PerformanceMetrics(
+                endpoint=f"/test/{i % 3}",
+                response_time_ms=float(500 + 100 * i),
+                cache_hit=i % 2 == 0,
+                api_calls_made=i % 2,
+                timestamp=datetime.utcnow(),
+                request_id=f"req-{i}",
+                status_code=500 if i % 4 == 0 else 200,
+                error_type="ServerError" if i % 4 == 0 else None
+            )
+            for i in range(150)
+        ]
+        one_by_one = MonitoringService(buffer_size=100, slow_request_threshold_ms=1000)
+        for metrics in batch:
+            one_by_one.record_request(metrics)
+        
+        monitoring_service.record_batch(iter(batch))
+        
+        assert monitoring_service.stats == one_by_one.stats
+        assert list(monitoring_service.metrics_buffer) == list(one_by_one.metrics_buffer)
+        assert monitoring_service.get_slow_requests() == one_by_one.get_slow_requests()
+        assert monitoring_service.get_stats()['response_time'] == one_by_one.get_stats()['response_time']
 
 
 class TestGlobalMonitoringService:
@@ -1,5 +1,8 @@
 """Unit tests for smart search capability detection and fallback functionality."""
 
+import gc
+import weakref
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 from src.services.service_capability_detector import ServiceCapabilityDetector
@@ -10,6 +13,14 @@ from src.models.responses import ProductResponse, ProductSearchResponse
 from datetime import datetime
 
 
+class BasicServiceStub:
+    """Minimal stand-in for the basic AliExpressService wrapped by the fallback."""
+    
+    def __init__(self):
+        self.get_products = Mock()
+        self.get_affiliate_links = Mock()
+
+
 class TestServiceCapabilityDetector:
     """Test ServiceCapabilityDetector functionality."""
     
@@ -85,6 +96,62 @@ class TestServiceCapabilityDetector:
         assert capabilities['has_image_processing'] is False
         assert capabilities['supports_affiliate_links'] is True
         assert capabilities['has_enhanced_features'] is False
+    
+    def test_get_capabilities_uses_class_methods(self):
+        """Test class-defined methods are detected and cached per class."""
+        class ClassMethodService:
+            async def smart_product_search(self, **kwargs):
+                pass
+            
+            def get_affiliate_links(self, urls):
+                pass
+        
+        service = ClassMethodService()
+        
+        capabilities = ServiceCapabilityDetector.get_capabilities(service)
+        class_capabilities = ServiceCapabilityDetector._class_capabilities(ClassMethodService)
+        ServiceCapabilityDetector.get_capabilities(ClassMethodService())
+        
+        assert capabilities['has_smart_search'] is True
+        assert capabilities['supports_affiliate_links'] is True
+        assert capabilities['has_caching'] is False
+        assert ServiceCapabilityDetector._class_capabilities(ClassMethodService) is class_capabilities
+    
+    def test_class_capabilities_do_not_keep_classes_alive(self):
+        """Test probed classes can be garbage collected."""
+        class TemporaryService:
+            pass
+        
+        ServiceCapabilityDetector.get_capabilities(TemporaryService())
+        class_ref = weakref.ref(TemporaryService)
+        del TemporaryService
+        gc.collect()
+        
+        assert class_ref() is None
+    
+    def test_get_capabilities_cached_on_instance(self):
+        """Test capabilities are detected once per service instance."""
+        mock_service = Mock(spec=AliExpressService)
+        mock_service.get_affiliate_links = Mock()
+        
+        capabilities = ServiceCapabilityDetector.get_capabilities(mock_service)
+        mock_service.smart_product_search = AsyncMock()
+        
+        assert ServiceCapabilityDetector.get_capabilities(mock_service) is capabilities
+        assert capabilities['has_smart_search'] is False
+        assert ServiceCapabilityDetector.get_capabilities(None)['has_smart_search'] is False
+    
+    def test_get_capabilities_not_shared_with_fallback_wrapper(self):
+        """Test a fallback wrapper does not pick up the wrapped service's capabilities."""
+        basic_service = BasicServiceStub()
+        
+        basic_capabilities = ServiceCapabilityDetector.get_capabilities(basic_service)
+        wrapper_capabilities = ServiceCapabilityDetector.get_capabilities(
+            SmartSearchFallback(basic_service)
+        )
+        
+        assert basic_capabilities['has_smart_search'] is False
+        assert wrapper_capabilities['has_smart_search'] is True
 
 
 class TestSmartSearchFallback:
@@ -92,7 +159,7 @@ class TestSmartSearchFallback:
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.mock_basic_service = Mock(spec=AliExpressService)
+        self.mock_basic_service = BasicServiceStub()
         self.fallback = SmartSearchFallback(self.mock_basic_service)
         
         # Setup mock product response
@@ -198,6 +265,20 @@ class TestSmartSearchFallback:
         # Test attribute access delegation
         self.mock_basic_service.some_attribute = "test_value"
         assert self.fallback.some_attribute == "test_value"
+    
+    def test_delegated_methods_are_cached(self):
+        """Test resolved methods are cached while data attributes stay live."""
+        get_products = self.fallback.get_products
+        assert self.fallback.__dict__['get_products'] is get_products
+        
+        self.mock_basic_service.some_attribute = "first"
+        assert self.fallback.some_attribute == "first"
+        self.mock_basic_service.some_attribute = "second"
+        assert self.fallback.some_attribute == "second"
+        
+        self.fallback.reset_delegation_cache()
+        assert 'get_products' not in self.fallback.__dict__
+        assert self.fallback.basic_service is self.mock_basic_service
 
 
 class TestServiceFactoryWithMetadata:
@@ -321,7 +402,7 @@ class TestProductionSafetyGuarantees:
     @pytest.mark.asyncio
     async def test_no_name_error_in_fallback_scenario(self):
         """Test that fallback scenario never causes NameError."""
-        mock_basic_service = Mock(spec=AliExpressService)
+        mock_basic_service = BasicServiceStub()
         mock_product = ProductResponse(
             product_id="123",
             product_title="Test Product", 
@@ -1,11 +1,87 @@
 """Quality gate enforcement script for CI/CD."""
 
+import hashlib
+import importlib.metadata
+import importlib.util
+import io
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+import tomllib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import partial
+from operator import attrgetter
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 from pathlib import Path
 
+# Trailing lines of streamed output kept for reports
+OUTPUT_TAIL_LINES = 200
+
+# External executables the checks run
+TOOLS = ("black", "ruff", "mypy", "bandit", "pytest", "git")
+
+# Digests of the trees each check last passed on, keyed by check name
+CACHE_FILE = ".quality_gate_cache.json"
+
+# Files outside the checked trees that change what the checks report
+CONFIG_FILES = (
+    "pyproject.toml", "setup.cfg", "pytest.ini", "tox.ini", "mypy.ini", "ruff.toml",
+    ".ruff.toml", ".coveragerc", ".bandit", "conftest.py",
+)
+
+# Per-tool stats of the files each per-file tool last passed on
+STATE_DIR = ".quality_gate_state"
+
+# Most stale files passed to a tool by name before falling back to the trees
+MAX_EXPLICIT_PATHS = 200
+
+# Checks whose tools judge each file independently, by tool name
+PER_FILE_TOOLS = {"Black Formatting": "black", "Ruff Linting": "ruff"}
+
+# Directories whose contents are generated and never affect a check
+SKIPPED_DIRS = {"__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache"}
+
+# Total row of the coverage report; the percentage is the last column and
+# has decimals when a report precision is configured
+_TOTAL_RE = re.compile(r"^TOTAL\s.*?(\d+(?:\.\d+)?)%\s*$")
+
+# Bandit issue severities from least to most severe
+SEVERITY_RANK = {"UNDEFINED": 0, "LOW": 1, "MEDIUM": 2, "HIGH": 3}
+
+
+def _available_cpus() -> int:
+    """
+    Count the CPUs this process is allowed to run on.
+    
+    Returns:
+        CPU count from the scheduler affinity where supported, else os.cpu_count()
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _tool_version(tool: str) -> str:
+    """
+    Look up the installed version of a tool's package.
+    
+    Args:
+        tool: Package name of the tool
+    
+    Returns:
+        Version string, empty if the package is not installed
+    """
+    try:
+        return importlib.metadata.version(tool)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
 
 @dataclass
 class CheckResult:
@@ -19,6 +95,17 @@ class CheckResult:
 class QualityGate:
     """Enforce code quality standards."""
     
+    # Fixed arguments of each tool; subclasses can override them. Ruff's
+    # --force-exclude applies the configured excludes to explicit file paths
+    # too; black gets the same through _black_force_exclude
+    _BLACK_ARGV: Tuple[str, ...] = ("--check",)
+    _RUFF_ARGV: Tuple[str, ...] = ("check", "--force-exclude")
+    _MYPY_ARGV: Tuple[str, ...] = (
+        "--cache-dir=.mypy_cache", "--sqlite-cache", "--incremental", "--ignore-missing-imports"
+    )
+    _BANDIT_ARGV: Tuple[str, ...] = ("-r", "src", "-f", "json", "-q")
+    _PYTEST_ARGV: Tuple[str, ...] = ("--failed-first", "--new-first", "--cov=src", "--cov-report=term")
+    
     def __init__(self, root_path: Path = None):
         """
         Initialize quality gate.
@@ -29,6 +116,23 @@ class QualityGate:
         self.root_path = root_path or Path.cwd()
         self.src_path = self.root_path / "src"
         self.tests_path = self.root_path / "tests"
+        
+        # Trees checked by full runs, relative to the root
+        self._paths = ("src", "tests")
+        
+        # Resolve executables on PATH once; a missing tool keeps its bare
+        # name so its check fails with the "not found" error from the OS
+        self._tools = {name: shutil.which(name) or name for name in TOOLS}
+    
+    def _progress(self, message: str) -> None:
+        """
+        Show a live progress line when writing to a terminal.
+        
+        Args:
+            message: Progress message
+        """
+        if sys.stdout.isatty():
+            print(message, flush=True)
     
     def run_command(self, command: List[str]) -> Tuple[int, str, str]:
         """
@@ -51,17 +155,337 @@ class QualityGate:
         except Exception as e:
             return 1, "", str(e)
     
-    def check_formatting(self) -> CheckResult:
+    def stream_command(self, command: List[str], tail_lines: int = OUTPUT_TAIL_LINES) -> Tuple[int, Deque[str]]:
+        """
+        Run a command, keeping only the last lines of its combined output.
+        
+        Output is read line by line while the command runs, so memory stays
+        bounded however much the command prints.
+        
+        Args:
+            command: Command to run as list of strings
+            tail_lines: Number of trailing output lines to keep
+        
+        Returns:
+            Tuple of (return_code, last lines of stdout and stderr)
+        """
+        tail: Deque[str] = deque(maxlen=tail_lines)
+        try:
+            with subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                cwd=self.root_path
+            ) as process:
+                assert process.stdout is not None
+                for line in process.stdout:
+                    tail.append(line.rstrip("\n"))
+            return process.returncode, tail
+        except Exception as e:
+            return 1, deque([str(e)])
+    
+    def _changed_files(self, base: str = "origin/main") -> Optional[List[str]]:
+        """
+        List Python files under src/ and tests/ changed since branching from base.
+        
+        Committed and uncommitted changes and untracked files that are not
+        ignored are all included.
+        
+        Args:
+            base: Git revision the current branch is compared against
+        
+        Returns:
+            Paths of changed Python files relative to the project root, or
+            None when git cannot tell (not a worktree, unknown base), meaning
+            scan everything
+        """
+        git = self._tools["git"]
+        returncode, toplevel, _ = self.run_command([git, "rev-parse", "--show-toplevel"])
+        if returncode != 0:
+            return None
+        
+        returncode, merge_base, _ = self.run_command([git, "merge-base", base, "HEAD"])
+        if returncode != 0:
+            return None
+        
+        returncode, changed, _ = self.run_command([
+            git, "diff", "--name-only", "--diff-filter=ACMR", merge_base.strip()
+        ])
+        if returncode != 0:
+            return None
+        
+        returncode, untracked, _ = self.run_command([
+            git, "ls-files", "--others", "--exclude-standard", "--full-name"
+        ])
+        if returncode != 0:
+            return None
+        
+        # git prints paths relative to the top of the worktree, which need
+        # not be the project root
+        top = Path(toplevel.strip())
+        root = self.root_path.resolve()
+        paths = []
+        for name in sorted(set(changed.splitlines()) | set(untracked.splitlines())):
+            try:
+                path = (top / name).resolve().relative_to(root).as_posix()
+            except ValueError:
+                continue
+            if path.endswith(".py") and path.split("/", 1)[0] in self._paths:
+                paths.append(path)
+        return paths
+    
+    def _snapshot(self, paths: Optional[Tuple[str, ...]] = None) -> Dict[str, List[int]]:
+        """
+        Record the modification time and size of the files under the given paths.
+        
+        Args:
+            paths: Directories relative to the project root, defaulting to
+                the checked trees
+        
+        Returns:
+            Mapping of relative file path to [mtime_ns, size]
+        """
+        snapshot = {}
+        pending = [str(self.root_path / path) for path in paths or self._paths]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRS:
+                        pending.append(entry.path)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    rel_path = os.path.relpath(entry.path, self.root_path)
+                    snapshot[rel_path] = [stat.st_mtime_ns, stat.st_size]
+        return snapshot
+    
+    def _digest(self, snapshot: Dict[str, List[int]]) -> str:
+        """
+        Compute a digest of a file snapshot.
+        
+        Files are identified by relative path, modification time and size,
+        so nothing is read and an unchanged tree always gives the same digest.
+        
+        Args:
+            snapshot: File stats from _snapshot
+        
+        Returns:
+            Hex digest of the file stats
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for rel_path, (mtime_ns, size) in sorted(snapshot.items()):
+            digest.update(f"{rel_path}\0{mtime_ns}\0{size}\n".encode())
+        return digest.hexdigest()
+    
+    def _config_snapshot(self) -> Dict[str, List[int]]:
+        """
+        Record the modification time and size of the project configuration.
+        
+        Returns:
+            Mapping of config file path to [mtime_ns, size] for files that exist
+        """
+        # The gate script itself is included, as its checks may have changed
+        files = [
+            *(self.root_path / name for name in CONFIG_FILES),
+            *self.root_path.glob("requirements*.txt"),
+            Path(__file__),
+        ]
+        snapshot = {}
+        for path in files:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[str(path)] = [stat.st_mtime_ns, stat.st_size]
+        return snapshot
+    
+    def _check_key(self, digest: str, name: str, tool: str, options: Tuple) -> str:
+        """
+        Build the cache key of one check.
+        
+        Args:
+            digest: Digest of the checked trees and project configuration
+            name: Display name of the check
+            tool: Tool the check runs
+            options: Options the check was given
+        
+        Returns:
+            Hex digest that changes with the files, tool version or arguments
+        """
+        key = hashlib.blake2b(digest.encode(), digest_size=16)
+        argv = getattr(self, f"_{tool.upper()}_ARGV")
+        key.update(repr((name, _tool_version(tool), argv, options, bool(os.environ.get("CI")))).encode())
+        return key.hexdigest()
+    
+    def _stale_files(self, tool: str, snapshot: Dict[str, List[int]], key: str) -> Optional[List[str]]:
+        """
+        List the Python files changed since a tool last passed on them.
+        
+        Every file is stale when there is no recorded state or it was
+        recorded under a different key, i.e. another configuration, gate
+        script, tool version or tool arguments.
+        
+        Args:
+            tool: Name of the tool the state was recorded for
+            snapshot: Current file stats from _snapshot
+            key: Key from _check_key over the project configuration alone
+        
+        Returns:
+            Sorted relative paths of Python files to check, or None to check
+            the whole trees when every file or too many files are stale
+        """
+        try:
+            with open(self.root_path / STATE_DIR / f"{tool}.json", encoding="utf-8") as f:
+                state = json.load(f)
+            passed = state["files"] if state["key"] == key else {}
+        except (OSError, ValueError, KeyError, TypeError):
+            passed = {}
+        python_files = [rel_path for rel_path in snapshot if rel_path.endswith(".py")]
+        stale = sorted(
+            rel_path for rel_path in python_files
+            if passed.get(rel_path) != snapshot[rel_path]
+        )
+        # Directory arguments keep long command lines within the OS limit
+        if len(stale) == len(python_files) or len(stale) > MAX_EXPLICIT_PATHS:
+            return None
+        return stale
+    
+    def _save_state(self, tool: str, snapshot: Dict[str, List[int]], key: str) -> None:
+        """
+        Record the Python files a tool passed on.
+        
+        Args:
+            tool: Name of the tool
+            snapshot: File stats the tool was run against
+            key: Key the state is valid for, as passed to _stale_files
+        """
+        state = {
+            "key": key,
+            "files": {
+                rel_path: stat for rel_path, stat in snapshot.items()
+                if rel_path.endswith(".py")
+            },
+        }
+        try:
+            (self.root_path / STATE_DIR).mkdir(exist_ok=True)
+            with open(self.root_path / STATE_DIR / f"{tool}.json", "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except OSError as e:
+            print(f"⚠️  Could not write {STATE_DIR}/{tool}.json: {e}")
+    
+    def _load_cache(self) -> Dict[str, str]:
+        """
+        Load the digests recorded by previous passing runs.
+        
+        Returns:
+            Mapping of check name to digest, empty if there is no usable cache
+        """
+        try:
+            with open(self.root_path / CACHE_FILE, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _save_cache(self, cache: Dict[str, str]) -> None:
+        """
+        Record the digests of passing checks.
+        
+        Args:
+            cache: Mapping of check name to digest
+        """
+        try:
+            with open(self.root_path / CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"⚠️  Could not write {CACHE_FILE}: {e}")
+    
+    def _has_py(self, path: Path) -> bool:
+        """
+        Check whether a directory contains any Python file.
+        
+        Args:
+            path: Directory to search recursively
+        
+        Returns:
+            True as soon as one .py file is found
+        """
+        return any(path.rglob("*.py"))
+    
+    def _python_trees(self) -> List[str]:
+        """
+        List the checked trees that contain Python files.
+        
+        Returns:
+            Checked trees relative to the root, skipping those with no Python files
+        """
+        return [path for path in self._paths if self._has_py(self.root_path / path)]
+    
+    def _black_force_exclude(self) -> List[str]:
+        """
+        Build black's option for applying the configured excludes to file paths.
+        
+        Black ignores exclude and extend-exclude for paths given explicitly
+        unless they are repeated as its --force-exclude pattern.
+        
+        Returns:
+            The --force-exclude option, or no options when nothing is excluded
+        """
+        try:
+            with open(self.root_path / "pyproject.toml", "rb") as f:
+                config = tomllib.load(f).get("tool", {}).get("black", {})
+        except (OSError, tomllib.TOMLDecodeError):
+            return []
+        patterns = [config[key] for key in ("exclude", "extend-exclude") if config.get(key)]
+        if not patterns:
+            return []
+        # Black compiles multi-line patterns in verbose mode, where a comment
+        # runs to the end of its line, so each group closes on a new line
+        combined = "|".join("(?:" + pattern + "\n)" for pattern in patterns)
+        return [f"--force-exclude={combined}"]
+    
+    def _unchanged_result(self, name: str, message: str = "No Python changes") -> CheckResult:
+        """
+        Build the result for a check with no files to inspect.
+        
+        Args:
+            name: Display name of the check
+            message: Why there was nothing to check
+        
+        Returns:
+            Passing CheckResult
+        """
+        return CheckResult(name=name, passed=True, message=message)
+    
+    def check_formatting(self, paths: Optional[List[str]] = None) -> CheckResult:
         """
         Verify code formatting with Black.
         
+        Args:
+            paths: Files to check instead of the whole src and tests trees
+        
         Returns:
             CheckResult with formatting check results
         """
-        print("🔍 Checking code formatting with Black...")
+        if paths == []:
+            return self._unchanged_result("Black Formatting")
+        exclude_options = self._black_force_exclude() if paths else []
+        if paths is None:
+            paths = self._python_trees()
+            if not paths:
+                return self._unchanged_result("Black Formatting", "No Python files")
+        
+        self._progress("🔍 Checking code formatting with Black...")
         
         returncode, stdout, stderr = self.run_command([
-            "black", "--check", "src", "tests"
+            self._tools["black"], *self._BLACK_ARGV, *exclude_options, *paths
         ])
         
         if returncode == 0:
@@ -79,17 +503,27 @@ class QualityGate:
                 output=stdout + stderr
             )
     
-    def check_linting(self) -> CheckResult:
+    def check_linting(self, paths: Optional[List[str]] = None) -> CheckResult:
         """
         Verify linting with Ruff.
         
+        Args:
+            paths: Files to check instead of the whole src and tests trees
+        
         Returns:
             CheckResult with linting check results
         """
-        print("🔍 Checking code with Ruff linter...")
+        if paths == []:
+            return self._unchanged_result("Ruff Linting")
+        if paths is None:
+            paths = self._python_trees()
+            if not paths:
+                return self._unchanged_result("Ruff Linting", "No Python files")
+        
+        self._progress("🔍 Checking code with Ruff linter...")
         
         returncode, stdout, stderr = self.run_command([
-            "ruff", "check", "src", "tests"
+            self._tools["ruff"], *self._RUFF_ARGV, *paths
         ])
         
         if returncode == 0:
@@ -107,17 +541,35 @@ class QualityGate:
                 output=stdout + stderr
             )
     
-    def check_type_coverage(self) -> CheckResult:
+    def check_type_coverage(self, paths: Optional[List[str]] = None) -> CheckResult:
         """
         Verify type annotation coverage with mypy.
         
+        Args:
+            paths: Files to check instead of the whole src tree; only files
+                under src/ are type checked
+        
         Returns:
             CheckResult with type checking results
         """
-        print("🔍 Checking type annotations with mypy...")
+        if paths is None:
+            if not self._has_py(self.src_path):
+                return self._unchanged_result("Type Checking (mypy)", "No Python files")
+            targets = ["src"]
+        else:
+            # Report errors in the given files only, not in what they import
+            targets = [path for path in paths if path.startswith("src/")]
+            if not targets:
+                return self._unchanged_result("Type Checking (mypy)")
+            targets.insert(0, "--follow-imports=silent")
+        
+        self._progress("🔍 Checking type annotations with mypy...")
+        
+        # The incremental cache lives in .mypy_cache so CI can persist it
+        ci_options = ["--cache-fine-grained"] if os.environ.get("CI") else []
         
         returncode, stdout, stderr = self.run_command([
-            "mypy", "src", "--ignore-missing-imports"
+            self._tools["mypy"], *self._MYPY_ARGV, *ci_options, *targets
         ])
         
         # mypy returns 0 if no errors, 1 if errors found
@@ -136,35 +588,58 @@ class QualityGate:
                 output=stdout + stderr
             )
     
-    def check_test_coverage(self) -> CheckResult:
+    def check_test_coverage(self, coverage_xml: bool = False, workers: Optional[int] = None) -> CheckResult:
         """
         Verify test coverage.
         
+        Args:
+            coverage_xml: Whether to write coverage.xml; it is always
+                written when the CI environment variable is set
+            workers: Number of pytest-xdist workers, defaulting to every
+                CPU this process may use
+        
         Returns:
             CheckResult with test coverage results
         """
-        print("🔍 Running tests with coverage...")
+        if not self._has_py(self.tests_path):
+            return self._unchanged_result("Test Coverage", "No Python files")
         
-        returncode, stdout, stderr = self.run_command([
-            "pytest", "--cov=src", "--cov-report=term", "--cov-report=xml"
+        self._progress("🔍 Running tests with coverage...")
+        
+        # Run tests that failed or were added since the last run first, using
+        # pytest's cache in the project root, so failures surface early
+        # The test run can print a lot, so only the tail of its output is kept
+        # Spread tests over the CPUs this process may use when pytest-xdist is
+        # installed; loadgroup keeps xdist_group-marked tests on one worker
+        xdist_options = []
+        if importlib.util.find_spec("xdist") is not None:
+            xdist_options = ["-n", str(workers or _available_cpus()), "--dist=loadgroup"]
+        
+        # coverage.xml is only read by CI uploaders
+        report_options = ["--cov-report=xml"] if coverage_xml or os.environ.get("CI") else []
+        
+        returncode, tail = self.stream_command([
+            self._tools["pytest"], *xdist_options, *self._PYTEST_ARGV, *report_options
         ])
+        output = "\n".join(tail)
         
         if returncode == 0:
-            # Parse coverage from output
-            coverage_line = [line for line in stdout.split('\n') if 'TOTAL' in line]
+            # Parse coverage from output; the TOTAL row closes the coverage table
+            match = next(filter(None, map(_TOTAL_RE.match, reversed(tail))), None)
+            coverage = f" coverage={match.group(1)}%" if match else ""
             
             return CheckResult(
                 name="Test Coverage",
                 passed=True,
-                message=f"All tests passed. {coverage_line[0] if coverage_line else ''}",
-                output=stdout
+                message=f"All tests passed.{coverage}",
+                output=output
             )
         else:
             return CheckResult(
                 name="Test Coverage",
                 passed=False,
                 message="Some tests failed",
-                output=stdout + stderr
+                output=output
             )
     
     def check_security(self) -> CheckResult:
@@ -174,86 +649,172 @@ class QualityGate:
         Returns:
             CheckResult with security check results
         """
-        print("🔍 Checking for security issues with Bandit...")
+        if not self._has_py(self.src_path):
+            return self._unchanged_result("Security Check (Bandit)", "No Python files")
+        
+        self._progress("🔍 Checking for security issues with Bandit...")
         
         returncode, stdout, stderr = self.run_command([
-            "bandit", "-r", "src", "-f", "txt"
+            self._tools["bandit"], *self._BANDIT_ARGV
         ])
         
+        try:
+            results = json.loads(stdout)["results"]
+        except (ValueError, KeyError, TypeError):
+            return CheckResult(
+                name="Security Check (Bandit)",
+                passed=False,
+                message="Could not parse Bandit report",
+                output=stdout + stderr
+            )
+        
         # Bandit returns 0 if no issues, 1 if issues found
-        if returncode == 0:
+        if returncode == 0 or not results:
             return CheckResult(
                 name="Security Check (Bandit)",
                 passed=True,
                 message="No security issues found",
                 output=stdout
             )
+        
+        max_severity = max(
+            (result.get("issue_severity", "UNDEFINED") for result in results),
+            key=lambda severity: SEVERITY_RANK.get(severity, len(SEVERITY_RANK))
+        )
+        if max_severity in ("UNDEFINED", "LOW"):
+            return CheckResult(
+                name="Security Check (Bandit)",
+                passed=True,
+                message=f"{len(results)} low severity issues found (acceptable)",
+                output=stdout
+            )
         else:
-            # Check if there are only low severity issues
-            if "Severity: Low" in stdout and "Severity: Medium" not in stdout and "Severity: High" not in stdout:
-                return CheckResult(
-                    name="Security Check (Bandit)",
-                    passed=True,
-                    message="Only low severity issues found (acceptable)",
-                    output=stdout
-                )
-            else:
-                return CheckResult(
-                    name="Security Check (Bandit)",
-                    passed=False,
-                    message="Security issues found",
-                    output=stdout + stderr
-                )
+            return CheckResult(
+                name="Security Check (Bandit)",
+                passed=False,
+                message=f"{len(results)} security issues found (max severity {max_severity})",
+                output=stdout + stderr
+            )
     
-    def validate(self, skip_tests: bool = False) -> bool:
+    def validate(self, skip_tests: bool = False, changed_only: bool = False,
+                 base: str = "origin/main", coverage_xml: bool = False) -> bool:
         """
         Run all quality checks.
         
         Args:
             skip_tests: Whether to skip running tests
+            changed_only: Whether to limit formatting, linting and type checks
+                to Python files changed since base
+            base: Git revision compared against when changed_only is set
+            coverage_xml: Whether the test run writes coverage.xml outside CI
         
         Returns:
             True if all checks pass, False otherwise
         """
-        print("\n" + "="*60)
-        print("🚀 Running Quality Gate Checks")
-        print("="*60 + "\n")
+        # The report is written in one go once every check has finished
+        report = io.StringIO()
+        print("\n" + "="*60, file=report)
+        print("🚀 Running Quality Gate Checks", file=report)
+        print("="*60 + "\n", file=report)
+        
+        # None means the full trees, also when git cannot list the changes
+        paths = self._changed_files(base) if changed_only else None
+        
+        # Checks that passed on an identical tree, configuration, tool version
+        # and arguments are not run again; runs limited to changed files
+        # neither use nor update the cache
+        use_cache = not changed_only
+        snapshot = self._snapshot() if use_cache else {}
+        cache = self._load_cache() if use_cache else {}
+        config_snapshot = self._config_snapshot() if use_cache else {}
+        digest = self._digest({**snapshot, **config_snapshot}) if use_cache else ""
         
-        checks = [
-            self.check_formatting,
-            self.check_linting,
-            self.check_type_coverage,
-            self.check_security,
+        # Black and ruff judge each file on its own, so full runs only pass
+        # them the files changed since they last passed with the same
+        # configuration, tool version and arguments
+        state_keys = {
+            tool: self._check_key(self._digest(config_snapshot), name, tool, ())
+            for name, tool in PER_FILE_TOOLS.items()
+        } if use_cache else {}
+        format_paths = self._stale_files("black", snapshot, state_keys["black"]) if use_cache else paths
+        lint_paths = self._stale_files("ruff", snapshot, state_keys["ruff"]) if use_cache else paths
+        
+        # (name, tool, options, run, cacheable); options are part of the key
+        checks: List[Tuple[str, str, Tuple, Callable[[], CheckResult], bool]] = [
+            ("Black Formatting", "black", (), partial(self.check_formatting, format_paths), True),
+            ("Ruff Linting", "ruff", (), partial(self.check_linting, lint_paths), True),
+            ("Type Checking (mypy)", "mypy", (), partial(self.check_type_coverage, paths), True),
+            ("Security Check (Bandit)", "bandit", (), self.check_security, True),
         ]
         
+        keys = {
+            name: self._check_key(digest, name, tool, options)
+            for name, tool, options, _, _ in checks
+        } if use_cache else {}
+        
         if not skip_tests:
-            checks.append(self.check_test_coverage)
+            # The tests run alongside the other checks, so give them only the
+            # CPUs left over by the checks that are not cache hits
+            running = sum(
+                1 for name, _, _, _, _ in checks
+                if not (use_cache and cache.get(name) == keys[name])
+            )
+            workers = max(1, _available_cpus() - running)
+            # A cached pass would not write the requested coverage.xml
+            writes_xml = coverage_xml or bool(os.environ.get("CI"))
+            checks.append((
+                "Test Coverage", "pytest", (coverage_xml,),
+                partial(self.check_test_coverage, coverage_xml, workers), not writes_xml
+            ))
+            if use_cache:
+                keys["Test Coverage"] = self._check_key(digest, "Test Coverage", "pytest", (coverage_xml,))
         
-        results = []
-        for check in checks:
-            result = check()
-            results.append(result)
-            
+        def run_check(check: Tuple[str, str, Tuple, Callable[[], CheckResult], bool]) -> CheckResult:
+            name, _, _, run, cacheable = check
+            if use_cache and cacheable and cache.get(name) == keys[name]:
+                return CheckResult(name=name, passed=True, message="cached")
+            return run()
+        
+        # The checks are independent subprocesses, so run them side by side;
+        # results are reported in the order the checks are listed
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(run_check, checks))
+        
+        if use_cache:
+            for result in results:
+                if result.passed:
+                    cache[result.name] = keys[result.name]
+                    if result.name in PER_FILE_TOOLS:
+                        tool = PER_FILE_TOOLS[result.name]
+                        self._save_state(tool, snapshot, state_keys[tool])
+                else:
+                    cache.pop(result.name, None)
+            self._save_cache(cache)
+        
+        for result in results:
             if result.passed:
-                print(f"✅ {result.name}: {result.message}")
+                print(f"✅ {result.name}: {result.message}", file=report)
             else:
-                print(f"❌ {result.name}: {result.message}")
+                print(f"❌ {result.name}: {result.message}", file=report)
                 if result.output:
-                    print(f"   Output: {result.output[:200]}...")
-            print()
+                    print(f"   Output: {result.output[:200]}...", file=report)
+            print(file=report)
         
-        print("="*60)
-        passed_count = sum(1 for r in results if r.passed)
+        print("="*60, file=report)
+        passed = list(map(attrgetter("passed"), results))
+        passed_count = passed.count(True)
         total_count = len(results)
         
-        if passed_count == total_count:
-            print(f"✅ All {total_count} quality checks passed!")
-            print("="*60 + "\n")
-            return True
+        all_passed = all(passed)
+        if all_passed:
+            print(f"✅ All {total_count} quality checks passed!", file=report)
         else:
-            print(f"❌ {total_count - passed_count} of {total_count} checks failed")
-            print("="*60 + "\n")
-            return False
+            print(f"❌ {total_count - passed_count} of {total_count} checks failed", file=report)
+        print("="*60 + "\n", file=report)
+        
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+        return all_passed
 
 
 def main():
@@ -266,11 +827,32 @@ def main():
         action="store_true",
         help="Skip running tests (faster for quick checks)"
     )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Format, lint and type check only Python files changed since --base"
+    )
+    parser.add_argument(
+        "--base",
+        default="origin/main",
+        help="Git revision to compare against with --changed-only (default: origin/main)"
+    )
+    
+    parser.add_argument(
+        "--coverage-xml",
+        action="store_true",
+        help="Write coverage.xml even outside CI"
+    )
     
     args = parser.parse_args()
     
     gate = QualityGate()
-    success = gate.validate(skip_tests=args.skip_tests)
+    success = gate.validate(
+        skip_tests=args.skip_tests,
+        changed_only=args.changed_only,
+        base=args.base,
+        coverage_xml=args.coverage_xml
+    )
     
     sys.exit(0 if success else 1)
 
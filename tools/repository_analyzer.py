@@ -34,6 +34,8 @@ class RepositoryAnalyzer:
         self.all_references: Dict[str, Set[str]] = defaultdict(set)
         self.imports_by_file: Dict[str, Set[str]] = defaultdict(set)
         self.module_dependencies: Dict[str, Set[str]] = defaultdict(set)
+        # Source, syntax tree and root-relative path of each parsed file
+        self._file_cache: Dict[Path, Tuple[str, ast.AST, Path]] = {}
     
     def analyze(self) -> AnalysisResult:
         """Run complete repository analysis."""
@@ -75,12 +77,21 @@ class RepositoryAnalyzer:
             if not any(excluded in py_file.parts for excluded in exclude_dirs):
                 self.python_files.append(py_file)
     
+    def _get_tree(self, file_path: Path) -> Tuple[str, ast.AST, Path]:
+        """Read and parse a file once, returning its source, tree and relative path."""
+        cached = self._file_cache.get(file_path)
+        if cached is None:
+            content = file_path.read_text(encoding='utf-8')
+            tree = ast.parse(content, filename=str(file_path))
+            cached = (content, tree, file_path.relative_to(self.root_path))
+            self._file_cache[file_path] = cached
+        return cached
+    
     def _build_symbol_tables(self):
         """Build symbol tables for all files."""
         for file_path in self.python_files:
             try:
-                content = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(content, filename=str(file_path))
+                _, tree, _ = self._get_tree(file_path)
                 
                 # Collect definitions
                 for node in ast.walk(tree):
@@ -129,7 +140,7 @@ class RepositoryAnalyzer:
                     continue
                 
                 if not is_referenced:
-                    rel_path = Path(file_path).relative_to(self.root_path)
+                    rel_path = self._file_cache[Path(file_path)][2]
                     self.analysis_result.dead_code.append(
                         f"{rel_path}::{definition} - Unused function/class"
                     )
@@ -138,8 +149,7 @@ class RepositoryAnalyzer:
         """Find unused imports in each file."""
         for file_path in self.python_files:
             try:
-                content = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(content, filename=str(file_path))
+                _, tree, rel_path = self._get_tree(file_path)
                 
                 imported_names = set()
                 used_names = set()
@@ -185,8 +195,7 @@ class RepositoryAnalyzer:
                 unused = imported_names - used_names
                 
                 if unused:
-                    rel_path = str(Path(file_path).relative_to(self.root_path))
-                    self.analysis_result.unused_imports[rel_path] = sorted(list(unused))
+                    self.analysis_result.unused_imports[str(rel_path)] = sorted(list(unused))
             
             except Exception as e:
                 print(f"   Warning: Could not analyze imports in {file_path}: {e}")
@@ -198,9 +207,8 @@ class RepositoryAnalyzer:
         
         for file_path in self.python_files:
             try:
-                content = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(content, filename=str(file_path))
-                rel_path = str(Path(file_path).relative_to(self.root_path))
+                _, tree, file_rel_path = self._get_tree(file_path)
+                rel_path = str(file_rel_path)
                 
                 # Analyze functions and methods for duplication
                 for node in ast.walk(tree):
@@ -328,8 +336,7 @@ class RepositoryAnalyzer:
         """Check for missing type annotations."""
         for file_path in self.python_files:
             try:
-                content = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(content, filename=str(file_path))
+                _, tree, rel_path = self._get_tree(file_path)
                 
                 total_functions = 0
                 typed_functions = 0
@@ -352,7 +359,6 @@ class RepositoryAnalyzer:
                         if node.returns:
                             typed_functions += 1
                         else:
-                            rel_path = Path(file_path).relative_to(self.root_path)
                             self.analysis_result.missing_types.append(
                                 f"{rel_path}:L{node.lineno}::{node.name} - Missing return type"
                             )
@@ -364,7 +370,6 @@ class RepositoryAnalyzer:
                                 if arg.annotation:
                                     typed_args += 1
                                 else:
-                                    rel_path = Path(file_path).relative_to(self.root_path)
                                     self.analysis_result.missing_types.append(
                                         f"{rel_path}:L{node.lineno}::{node.name}({arg.arg}) - Missing argument type"
                                     )
@@ -384,7 +389,6 @@ class RepositoryAnalyzer:
                                         # Skip private/dunder attributes
                                         if not target.id.startswith('_'):
                                             total_class_attrs += 1
-                                            rel_path = Path(file_path).relative_to(self.root_path)
                                             self.analysis_result.missing_types.append(
                                                 f"{rel_path}:L{item.lineno}::{node.name}.{target.id} - Missing class attribute type"
                                             )
@@ -400,7 +404,6 @@ class RepositoryAnalyzer:
                                                         # Skip private attributes
                                                         if not target.attr.startswith('_'):
                                                             total_class_attrs += 1
-                                                            rel_path = Path(file_path).relative_to(self.root_path)
                                                             self.analysis_result.missing_types.append(
                                                                 f"{rel_path}:L{stmt.lineno}::{node.name}.{target.attr} - Missing instance attribute type"
                                                             )
@@ -417,8 +420,7 @@ class RepositoryAnalyzer:
                 
                 if total_items > 0:
                     coverage = (typed_items / total_items) * 100
-                    rel_path = str(Path(file_path).relative_to(self.root_path))
-                    self.analysis_result.type_coverage[rel_path] = round(coverage, 2)
+                    self.analysis_result.type_coverage[str(rel_path)] = round(coverage, 2)
             
             except Exception as e:
                 print(f"   Warning: Could not analyze types in {file_path}: {e}")
@@ -436,13 +438,18 @@ class RepositoryAnalyzer:
         
         for file_path in self.python_files:
             try:
-                content = file_path.read_text(encoding='utf-8')
+                # Files that failed to parse are still scanned line by line
+                cached = self._file_cache.get(file_path)
+                if cached is not None:
+                    content, _, rel_path = cached
+                else:
+                    content = file_path.read_text(encoding='utf-8')
+                    rel_path = file_path.relative_to(self.root_path)
                 lines = content.split('\n')
                 
                 for line_num, line in enumerate(lines, 1):
                     for pattern, description in deprecated_patterns:
                         if re.search(pattern, line):
-                            rel_path = Path(file_path).relative_to(self.root_path)
                             self.analysis_result.deprecated_patterns.append(
                                 f"{rel_path}:L{line_num} - {description}"
                             )
@@ -488,12 +495,9 @@ class RepositoryAnalyzer:
         """Check naming convention consistency."""
         for file_path in self.python_files:
             try:
-                content = file_path.read_text(encoding='utf-8')
-                tree = ast.parse(content, filename=str(file_path))
+                _, tree, rel_path = self._get_tree(file_path)
                 
                 for node in ast.walk(tree):
-                    rel_path = Path(file_path).relative_to(self.root_path)
-                    
                     # Check function names (should be snake_case)
                     if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                         # Skip dunder methods and AST visitor methods (visit_*)
@@ -523,8 +527,7 @@ class RepositoryAnalyzer:
             # Check if API endpoints import from other API endpoints
             if 'api' in parts and 'endpoints' in parts:
                 try:
-                    content = file_path.read_text(encoding='utf-8')
-                    tree = ast.parse(content, filename=str(file_path))
+                    _, tree, _ = self._get_tree(file_path)
                     
                     for node in ast.walk(tree):
                         if isinstance(node, ast.ImportFrom):